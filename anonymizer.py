@@ -0,0 +1,162 @@
+"""
+Anonymizer
+Keyed BLAKE2b digests and masking for candidate data, with an LRU of recent digests.
+"""
+
+import hashlib
+import os
+import secrets
+import threading
+import uuid
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from config import PRIVACY_CONFIG
+
+# BLAKE2b accepts keys up to 64 bytes and personalization strings up to 16 bytes
+MAX_KEY_BYTES = 64
+
+
+class Anonymizer:
+    """
+    Replaces identifiers with keyed BLAKE2b digests. Without the key the digests cannot
+    be reversed by hashing a dictionary of emails; with the same key a dataset is
+    anonymized identically everywhere. Each purpose ("email", "candidate_id", ...) is
+    personalized separately, so digests of one kind never match another.
+    """
+
+    def __init__(self, key: bytes, cache_size: int = 4096):
+        """Initialize with a secret key and the number of recent digests to cache"""
+        if not key:
+            raise ValueError("Anonymization key must not be empty")
+        if len(key) > MAX_KEY_BYTES:
+            key = hashlib.blake2b(key).digest()
+        self._key = key
+        self._bases = {}
+        self._cached_digest = lru_cache(maxsize=cache_size)(self._digest) if cache_size else self._digest
+
+    def _hasher(self, purpose: str, digest_size: int):
+        # Keying costs a compression block; copying a pre-keyed state skips it
+        base = self._bases.get((purpose, digest_size))
+        if base is None:
+            base = hashlib.blake2b(key=self._key, digest_size=digest_size, person=purpose.encode()[:16])
+            self._bases[(purpose, digest_size)] = base
+        return base.copy()
+
+    def _digest(self, value: str, purpose: str, length: int) -> str:
+        hasher = self._hasher(purpose, (length + 1) // 2)
+        hasher.update(value.encode('utf-8'))
+        return hasher.hexdigest()[:length]
+
+    def digest(self, value: str, purpose: str = "email", length: int = 16) -> str:
+        """Keyed hex digest of value (served from the LRU when recently seen)"""
+        return self._cached_digest(value, purpose, length)
+
+    def digest_batch(self, values: Iterable[str], purpose: str = "email", length: int = 16) -> List[str]:
+        """Digest many values: keyed state is set up once and each distinct value hashed once"""
+        base = self._hasher(purpose, (length + 1) // 2)  # one keyed state for the whole batch
+        digests = {}
+        result = []
+        for value in values:
+            digest = digests.get(value)
+            if digest is None:
+                hasher = base.copy()
+                hasher.update(value.encode('utf-8'))
+                digest = digests[value] = hasher.hexdigest()[:length]
+            result.append(digest)
+        return result
+
+    def candidate_id(self, email: str, timestamp: str) -> str:
+        """New unique candidate ID; a random nonce keeps same-instant saves apart"""
+        nonce = uuid.uuid4().hex
+        return f"CAND_{self._digest(f'{email}_{timestamp}_{nonce}', 'candidate_id', 12)}"
+
+    @staticmethod
+    def mask_phone(phone: str) -> Optional[str]:
+        """Keep the first and last three characters of a phone number"""
+        if len(phone) < 10:
+            return None
+        return phone[:3] + '*' * (len(phone) - 6) + phone[-3:]
+
+    def _apply(self, data: Dict, email_hash: Optional[str]) -> Dict:
+        anonymized = data.copy()
+
+        # Hash email for privacy
+        if 'email' in anonymized:
+            anonymized['email_hash'] = email_hash
+            del anonymized['email']  # Remove original email
+
+        # Partially mask phone number
+        if 'phone' in anonymized:
+            masked = self.mask_phone(str(anonymized['phone']))
+            if masked:
+                anonymized['phone_masked'] = masked
+                del anonymized['phone']  # Remove original phone
+
+        return anonymized
+
+    def anonymize(self, data: Dict) -> Dict:
+        """Anonymize one candidate dict"""
+        email_hash = self.digest(str(data['email'])) if 'email' in data else None
+        return self._apply(data, email_hash)
+
+    def anonymize_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Anonymize many candidate dicts with one batched digest pass over their emails"""
+        emails = [str(data['email']) for data in batch if 'email' in data]
+        hashes = iter(self.digest_batch(emails))
+        return [self._apply(data, next(hashes) if 'email' in data else None) for data in batch]
+
+
+def load_key(key_file: str) -> bytes:
+    """
+    Read the key from the environment variable named in PRIVACY_CONFIG (the supported
+    production setup), else from key_file, creating a random one there on first use.
+    """
+    env_name = PRIVACY_CONFIG["anonymization_key_env"]
+    env_key = os.getenv(env_name)
+    if env_key:
+        try:
+            return bytes.fromhex(env_key)
+        except ValueError:
+            return env_key.encode('utf-8')
+
+    # The file sits next to the digests it protects, so anyone with a copy of the data
+    # directory can rebuild the email dictionary; fine for development only
+    print(f"Warning: {env_name} is not set; using the anonymization key in {key_file}. "
+          f"Set {env_name} in production and keep the key out of the data directory.")
+    try:
+        with open(key_file, 'rb') as f:
+            return bytes.fromhex(f.read().decode().strip())
+    except FileNotFoundError:
+        pass
+
+    key = secrets.token_bytes(32)
+    os.makedirs(os.path.dirname(key_file) or ".", exist_ok=True)
+    tmp_path = f"{key_file}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(key.hex())
+    try:
+        # link() fails if the key exists, so processes racing on first use agree on one key
+        os.link(tmp_path, key_file)
+    except FileExistsError:
+        with open(key_file, 'rb') as f:
+            return bytes.fromhex(f.read().decode().strip())
+    finally:
+        os.remove(tmp_path)
+    return key
+
+
+_lock = threading.Lock()
+_anonymizers = {}
+
+
+def get_anonymizer(data_dir: str) -> Anonymizer:
+    """Return the process-wide anonymizer for a data directory's key"""
+    key_file = os.path.join(data_dir, PRIVACY_CONFIG["anonymization_key_file"])
+    with _lock:
+        anonymizer = _anonymizers.get(key_file)
+        if anonymizer is None:
+            anonymizer = Anonymizer(load_key(key_file), cache_size=PRIVACY_CONFIG["digest_cache_size"])
+            _anonymizers[key_file] = anonymizer
+        return anonymizer
@@ -4,12 +4,16 @@ A sophisticated AI-powered chatbot for technical candidate screening and assessm
 """
 
 import streamlit as st
-import json
 import re
 from datetime import datetime
 from typing import Dict, List, Optional
 from chatbot import HiringAssistant
+from config import CANDIDATE_FIELD_LABELS, INTERVIEW_PHASE_LABELS, PERFORMANCE_CONFIG
 from data_handler import DataHandler
+from interview_export import build_interview_export, export_file_name, export_to_buffer
+from llm_client import get_shared_client
+from static_assets import HEADER_HTML, INFO_CARDS_HTML, get_css_html
+from stream_renderer import ThrottledStreamRenderer
 from utils import validate_email, validate_phone
 
 # Configure Streamlit page
@@ -20,18 +24,21 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Export format label -> (compact, gzip)
+EXPORT_FORMATS = {
+    "Readable JSON": (False, False),
+    "Compact JSON": (True, False),
+    "Compact JSON (gzip)": (True, True)
+}
+
+# Phases shown in the sidebar checklist ('completed' has no step of its own)
+PHASE_ORDER = tuple(INTERVIEW_PHASE_LABELS)
+
 # Load custom CSS with automatic theme detection
 def load_css():
-    """Load custom CSS from external file"""
+    """Load custom CSS from external file (read once per process, see static_assets)"""
     try:
-        with open("static/styles.css", "r", encoding="utf-8") as f:
-            css_content = f.read()
-        
-        st.markdown(f"""
-        <style>
-        {css_content}
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(get_css_html("static/styles.css"), unsafe_allow_html=True)
     except FileNotFoundError:
         st.error("⚠️ CSS file not found. Please ensure 'static/styles.css' exists.")
     except Exception as e:
@@ -40,10 +47,10 @@ def load_css():
 def initialize_session_state():
     """Initialize session state variables"""
     if 'chatbot' not in st.session_state:
-        st.session_state.chatbot = HiringAssistant()
+        st.session_state.chatbot = HiringAssistant(client=get_shared_client())
     
     if 'data_handler' not in st.session_state:
-        st.session_state.data_handler = DataHandler()
+        st.session_state.data_handler = DataHandler(start_retention=True)
     
     if 'conversation_started' not in st.session_state:
         st.session_state.conversation_started = False
@@ -65,85 +72,64 @@ def initialize_session_state():
 
 def render_header():
     """Render the main application header"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🤖 TalentScout AI</h1>
-        <p>Intelligent Hiring Assistant for Technology Placements</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+def _progress_markdown(progress) -> str:
+    """Phase checklist and position, as one markdown block"""
+    lines = []
+    for index, phase in enumerate(PHASE_ORDER):
+        status = "✅" if index < progress.phase_index else ("🔄" if index == progress.phase_index else "⏳")
+        lines.append(f"{status} {INTERVIEW_PHASE_LABELS[phase]}")
+    lines.append("")
+    lines.append(f"**Current Phase:** {progress.phase.replace('_', ' ').title()}")
+    lines.append(f"**Progress:** {min(progress.phase_index + 1, progress.total_phases)}/{progress.total_phases}")
+    return "  \n".join(lines)
+
+def _candidate_markdown(progress) -> str:
+    """Collected and missing candidate fields, as one markdown block"""
+    total = len(progress.collected_fields) + len(progress.missing_fields)
+    lines = [f"**Collected:** {len(progress.collected_fields)}/{total} fields"]
+    if progress.collected_fields:
+        lines.append("")
+        lines.append("**✅ Information Collected:**")
+        values = dict(progress.candidate_data)
+        for field in progress.collected_fields:
+            value = values[field]
+            if field == 'experience' and 'year' not in value.lower():
+                value = f"{value} years"
+            lines.append(f"{CANDIDATE_FIELD_LABELS.get(field, field)} {value}")
+    if progress.missing_fields:
+        lines.append("")
+        lines.append("**⏳ Still Need:**")
+        lines.extend(f"• {field.replace('_', ' ').title()}" for field in progress.missing_fields)
+    return "  \n".join(lines)
+
+def get_sidebar_markdown(progress) -> tuple:
+    """Sidebar blocks for a progress snapshot, rebuilt only when its version changes"""
+    cached = st.session_state.get('sidebar_cache')
+    if cached is None or cached[0] != progress.version:
+        cached = (progress.version, _progress_markdown(progress),
+                  _candidate_markdown(progress) if progress.candidate_data else None)
+        st.session_state.sidebar_cache = cached
+    return cached[1], cached[2]
 
 def render_sidebar():
     """Render the sidebar with progress and information"""
     with st.sidebar:
         st.markdown("### 📊 Interview Progress")
         
-        # Get current phase info from chatbot
+        # Render from the chatbot's immutable progress snapshot
         if hasattr(st.session_state, 'chatbot'):
-            current_phase = st.session_state.chatbot.interview_phases[st.session_state.chatbot.current_phase_index]
-            phase_index = st.session_state.chatbot.current_phase_index
-            total_phases = len(st.session_state.chatbot.interview_phases)
-            
-            # Define progress steps based on actual interview phases
-            progress_steps = [
-                ("🎯 Greeting", phase_index > 0),
-                ("📋 Information Gathering", phase_index > 1), 
-                ("🔧 Technical Assessment", phase_index > 2),
-                ("💼 Experience Discussion", phase_index > 3),
-                ("🚀 Project Deep Dive", phase_index > 4),
-                ("🤝 Cultural Fit", phase_index > 5),
-                ("❓ Your Questions", phase_index > 6),
-                ("✅ Next Steps", phase_index > 7)
-            ]
-            
-            for step_name, completed in progress_steps:
-                status = "✅" if completed else ("🔄" if step_name.lower().replace("🎯 ", "").replace("📋 ", "").replace("🔧 ", "").replace("💼 ", "").replace("🚀 ", "").replace("🤝 ", "").replace("❓ ", "").replace("✅ ", "") == current_phase.replace("_", " ") else "⏳")
-                st.markdown(f"{status} {step_name}")
-            
-            # Show current phase info
-            st.markdown(f"**Current Phase:** {current_phase.replace('_', ' ').title()}")
-            st.markdown(f"**Progress:** {phase_index + 1}/{total_phases}")
+            progress_md, candidate_md = get_sidebar_markdown(st.session_state.chatbot.get_progress())
+            st.markdown(progress_md)
         else:
+            candidate_md = None
             st.markdown("⏳ Starting interview...")
         
         st.markdown("---")
         
-        # Display candidate information if available
-        if st.session_state.candidate_data:
-            st.markdown("### 👤 Candidate Info")
-            candidate = st.session_state.candidate_data
-            
-            # Required fields tracking
-            required_fields = ['name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack']
-            collected_fields = [field for field in required_fields if field in candidate and candidate[field]]
-            missing_fields = [field for field in required_fields if field not in candidate or not candidate[field]]
-            
-            st.markdown(f"**Collected:** {len(collected_fields)}/{len(required_fields)} fields")
-            
-            if collected_fields:
-                st.markdown("**✅ Information Collected:**")
-                if 'name' in candidate:
-                    st.markdown(f"📝 **Name:** {candidate['name']}")
-                if 'email' in candidate:
-                    st.markdown(f"📧 **Email:** {candidate['email']}")
-                if 'phone' in candidate:
-                    st.markdown(f"📞 **Phone:** {candidate['phone']}")
-                if 'experience' in candidate:
-                    st.markdown(f"⏰ **Experience:** {candidate['experience']} years")
-                if 'position' in candidate:
-                    st.markdown(f"💼 **Position:** {candidate['position']}")
-                if 'location' in candidate:
-                    st.markdown(f"📍 **Location:** {candidate['location']}")
-                if 'tech_stack' in candidate:
-                    st.markdown(f"⚙️ **Tech Stack:** {candidate['tech_stack']}")
-            
-            if missing_fields:
-                st.markdown("**⏳ Still Need:**")
-                for field in missing_fields:
-                    field_display = field.replace('_', ' ').title()
-                    st.markdown(f"• {field_display}")
-        else:
-            st.markdown("### 👤 Candidate Info")
-            st.markdown("*No information collected yet*")
+        st.markdown("### 👤 Candidate Info")
+        st.markdown(candidate_md or "*No information collected yet*")
         
         st.markdown("---")
           # Control buttons
@@ -152,52 +138,20 @@ def render_sidebar():
                 del st.session_state[key]
             st.rerun()
             
+        export_format = st.selectbox("Export format", list(EXPORT_FORMATS), key="export_format")
         if st.button("💾 Export Data", use_container_width=True):
             if st.session_state.candidate_data:
-                # Use the comprehensive interview export
+                # Built only on click and serialized straight into a buffer, never held as one JSON string
+                compact, compress = EXPORT_FORMATS[export_format]
                 try:
-                    interview_summary = st.session_state.chatbot.get_conversation_summary()
-                    
-                    # Create comprehensive export data
-                    export_data = {
-                        'export_metadata': {
-                            'exported_at': datetime.now().isoformat(),
-                            'export_version': '2.0',
-                            'interview_system': 'TalentScout AI Hiring Assistant'
-                        },
-                        'candidate_information': st.session_state.candidate_data,
-                        'interview_summary': {
-                            'current_phase': interview_summary.get('current_phase', 'Unknown'),
-                            'phase_index': interview_summary.get('phase_index', 0),
-                            'completion_percentage': interview_summary.get('completion_percentage', 0),
-                            'interview_completed': interview_summary.get('interview_completed', False),
-                            'missing_information': interview_summary.get('missing_information', [])
-                        },
-                        'full_conversation': getattr(st.session_state.chatbot, 'conversation_history', []),
-                        'interview_analysis': {
-                            'information_completeness': interview_summary.get('completion_percentage', 0),
-                            'engagement_level': min(100, len(getattr(st.session_state.chatbot, 'conversation_history', [])) * 3),
-                            'total_messages': len(getattr(st.session_state.chatbot, 'conversation_history', [])),
-                            'estimated_duration': f"{len(getattr(st.session_state.chatbot, 'conversation_history', [])) * 0.5:.1f} minutes",
-                            'phases_covered': interview_summary.get('phase_index', 0) + 1
-                        },
-                        'conversation_transcript': [
-                            {
-                                'speaker': 'Assistant' if msg['role'] == 'assistant' else 'Candidate',
-                                'message': msg['content'],
-                                'timestamp': msg.get('timestamp', 'Unknown')
-                            }
-                            for msg in getattr(st.session_state.chatbot, 'conversation_history', [])
-                        ]
-                    }
-                    
-                    data_json = json.dumps(export_data, indent=2, ensure_ascii=False)
+                    export_data = build_interview_export(st.session_state.chatbot, st.session_state.candidate_data)
                     
                     st.download_button(
                         label="📥 Download Complete Interview Data",
-                        data=data_json,
-                        file_name=f"interview_{st.session_state.candidate_data.get('name', 'candidate').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
+                        data=export_to_buffer(export_data, compact=compact, compress=compress),
+                        file_name=export_file_name(st.session_state.candidate_data, compress=compress),
+                        mime="application/gzip" if compress else "application/json",
+                        on_click="ignore"
                     )
                     
                     st.success("✅ Interview data prepared for download!")
@@ -205,51 +159,85 @@ def render_sidebar():
                 except Exception as e:
                     st.error(f"Export failed: {e}")
                     # Fallback to basic export
-                    data_json = json.dumps(st.session_state.candidate_data, indent=2)
                     st.download_button(
                         label="📥 Download Basic Data",
-                        data=data_json,
+                        data=export_to_buffer(st.session_state.candidate_data, compact=compact),
                         file_name=f"candidate_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
+                        mime="application/json",
+                        on_click="ignore"
                     )
             else:
                 st.warning("No candidate data to export yet.")
 
+def _message_markdown(message: Dict) -> str:
+    speaker = "🧑 **You:**" if message['role'] == 'user' else "🤖 **TalentScout:**"
+    return f"{speaker} {message['content']}"
+
+def get_earlier_transcript(history: List[Dict], count: int) -> str:
+    """Markdown for history[:count], extended incrementally and kept in session state"""
+    cache = st.session_state.get('transcript_cache')
+    if cache is None or count < cache['count']:
+        # First use, or the history was reset
+        cache = {'count': 0, 'text': ''}
+        st.session_state.transcript_cache = cache
+    
+    if count > cache['count']:
+        new_parts = [_message_markdown(message) for message in history[cache['count']:count]
+                     if message['role'] in ('user', 'assistant')]
+        if new_parts:
+            separator = "\n\n---\n\n"
+            cache['text'] = separator.join(([cache['text']] if cache['text'] else []) + new_parts)
+        cache['count'] = count
+    
+    return cache['text']
+
 def render_chat_interface():
     """Render the main chat interface using Streamlit's chat elements"""
-    # Display conversation history using st.chat_message
-    if hasattr(st.session_state.chatbot, 'conversation_history'):
-        for message in st.session_state.chatbot.conversation_history:
-            if message['role'] == 'user':
-                with st.chat_message("user"):
-                    st.markdown(message["content"])
-            elif message['role'] == 'assistant':
-                with st.chat_message("assistant"):
-                    st.markdown(message["content"])
+    history = getattr(st.session_state.chatbot, 'conversation_history', [])
+    
+    # Older messages collapse into one memoized markdown block instead of one element pair each
+    window = PERFORMANCE_CONFIG["chat_render_window"]
+    first_bubble = max(0, len(history) - window)
+    if first_bubble:
+        with st.expander(f"Earlier messages ({first_bubble})"):
+            st.markdown(get_earlier_transcript(history, first_bubble))
+    
+    # Display recent conversation history using st.chat_message
+    for message in history[first_bubble:]:
+        if message['role'] == 'user':
+            with st.chat_message("user"):
+                st.markdown(message["content"])
+        elif message['role'] == 'assistant':
+            with st.chat_message("assistant"):
+                st.markdown(message["content"])
+
+def _sidebar_signature() -> tuple:
+    """State shown outside the chat area; a full-app rerun is needed only when it changes"""
+    return (st.session_state.chatbot.get_progress().version, st.session_state.conversation_ended)
 
-def handle_user_input():
+def handle_user_input(transcript):
     """Handle user input and generate bot responses with streaming"""
     user_input = st.chat_input("Type your message here...", key="user_input")
     
     if user_input and not st.session_state.conversation_ended:
-        # Display user message immediately
-        with st.chat_message("user"):
+        sidebar_before = _sidebar_signature()
+        
+        # Display user message immediately, at the end of the transcript (above the input box)
+        with transcript.chat_message("user"):
             st.markdown(user_input)
         
         # Display streaming assistant response
-        with st.chat_message("assistant"):
+        with transcript.chat_message("assistant"):
             message_placeholder = st.empty()
-            full_response = ""
+            renderer = ThrottledStreamRenderer(message_placeholder)
             
             try:
-                # Process user input through the chatbot with streaming
+                # Process user input through the chatbot with streaming; redraws are batched
                 for chunk in st.session_state.chatbot.process_message_stream(user_input):
-                    full_response += chunk
-                    # Update display with current response + typing indicator
-                    message_placeholder.markdown(full_response + "▌")
+                    renderer.write(chunk)
                 
                 # Final update without cursor
-                message_placeholder.markdown(full_response)
+                full_response = renderer.finish()
                 
             except Exception as e:
                 # Fallback to non-streaming if streaming fails
@@ -270,7 +258,9 @@ def handle_user_input():
             st.session_state.conversation_ended = True
             st.session_state.data_handler.save_candidate_data(st.session_state.candidate_data)
         
-        st.rerun()
+        # The new messages are already on screen; only rerun the whole app if the sidebar is stale
+        if _sidebar_signature() != sidebar_before:
+            st.rerun(scope="app")
 
 def handle_user_input_stream():
     """Alternative streaming handler using st.write_stream"""
@@ -311,33 +301,29 @@ def handle_user_input_stream():
             st.session_state.conversation_ended = True
             st.session_state.data_handler.save_candidate_data(st.session_state.candidate_data)
 
-def render_info_cards():
-    """Render informational cards with consistent spacing"""
-    col1, col2, col3 = st.columns(3, gap="medium")
+@st.fragment
+def render_chat_area():
+    """Chat transcript and input; a message reruns only this fragment, not the whole page"""
+    # Render chat interface; created before the inline chat input so new turns are drawn above it
+    transcript = st.container()
+    with transcript:
+        render_chat_interface()
     
-    with col1:
-        st.markdown("""
-        <div class="info-card">
-            <h3>🎯 Purpose</h3>
-            <p>Our AI assistant guides you through initial screening, gathering information and assessing technical skills.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Handle user input with streaming (using more reliable method)
+    handle_user_input(transcript)
     
-    with col2:
-        st.markdown("""
-        <div class="info-card">
-            <h3>⏱️ Duration</h3>
-            <p>Interview typically takes 10-15 minutes, depending on your responses and background.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Show completion message if interview is done
+    if st.session_state.conversation_ended:
+        st.success("🎉 Interview completed! Thank you for your time.")
+        st.info("Our team will review your responses and get back to you soon.")
+
+def render_info_cards():
+    """Render informational cards with consistent spacing"""
+    columns = st.columns(len(INFO_CARDS_HTML), gap="medium")
     
-    with col3:
-        st.markdown("""
-        <div class="info-card">
-            <h3>🔒 Privacy</h3>
-            <p>Your information is handled securely in compliance with data privacy standards.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for column, card_html in zip(columns, INFO_CARDS_HTML):
+        with column:
+            st.markdown(card_html, unsafe_allow_html=True)
 
 def main():
     """Main application function"""
@@ -362,16 +348,7 @@ def main():
                 greeting = st.session_state.chatbot.get_greeting()
                 st.rerun()
         else:
-            # Render chat interface
-            render_chat_interface()
-            
-            # Handle user input with streaming (using more reliable method)
-            handle_user_input()
-            
-            # Show completion message if interview is done
-            if st.session_state.conversation_ended:
-                st.success("🎉 Interview completed! Thank you for your time.")
-                st.info("Our team will review your responses and get back to you soon.")
+            render_chat_area()
     
     with col2:
         render_sidebar()
@@ -0,0 +1,114 @@
+"""
+Concurrent Saves Stress Test
+Runs many simultaneous saves (and deletes) from several processes and threads,
+each with its own DataHandler on a shared data directory, then checks that every
+saved record is present, every deleted one is gone, the file parses cleanly and
+the running statistics agree with the stored records.
+
+Usage:
+    python benchmarks/concurrent_saves.py
+    python benchmarks/concurrent_saves.py --processes 8 --threads 8 --saves 200 --backend sqlite
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_handler import DataHandler
+
+
+def _worker(data_dir: str, backend: str, worker_id: int, threads: int, saves: int, delete_every: int) -> tuple:
+    """Save from several threads in one process; returns (kept ids, deleted ids)"""
+    kept, deleted = [], []
+    results_lock = threading.Lock()
+
+    def run(thread_id: int):
+        # One DataHandler per thread, like one per Streamlit session
+        handler = DataHandler(data_dir, storage_backend=backend)
+        for i in range(saves):
+            candidate_id = handler.save_candidate_data({
+                "name": "Stress Candidate",
+                "email": f"p{worker_id}.t{thread_id}.n{i}@example.com",
+                "tech_stack": ["python", "docker"]
+            }, session_id=f"session-{worker_id}-{thread_id}")
+            if candidate_id is None:
+                raise RuntimeError("save failed")
+            if delete_every and i % delete_every == 0 and handler.delete_candidate_data(candidate_id):
+                with results_lock:
+                    deleted.append(candidate_id)
+            else:
+                with results_lock:
+                    kept.append(candidate_id)
+        # Pool workers exit without running atexit hooks
+        if not handler.flush():
+            raise RuntimeError(f"flush failed: {getattr(handler.store, 'last_error', None)}")
+
+    workers = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return kept, deleted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--saves", type=int, default=100, help="Saves per thread")
+    parser.add_argument("--delete-every", type=int, default=5,
+                        help="Delete every Nth saved record to exercise tombstones and compaction (0 = never)")
+    parser.add_argument("--backend", choices=["jsonl", "sqlite"], default="jsonl")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="talentscout-stress-")
+    DataHandler(data_dir, storage_backend=args.backend)  # create the store up front
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        results = pool.starmap(_worker, [
+            (data_dir, args.backend, p, args.threads, args.saves, args.delete_every)
+            for p in range(args.processes)
+        ])
+    elapsed = time.perf_counter() - start
+
+    kept = {cid for ids, _ in results for cid in ids}
+    deleted = {cid for _, ids in results for cid in ids}
+    total = args.processes * args.threads * args.saves
+
+    handler = DataHandler(data_dir, storage_backend=args.backend)
+    stored = {record["candidate_id"] for record in handler.store.iter_records()}
+
+    torn_lines = 0
+    if args.backend == "jsonl":
+        with open(handler.candidates_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError:
+                    torn_lines += 1
+
+    stats_total = handler.get_statistics().get("total_candidates", 0)
+
+    missing = kept - stored
+    resurrected = deleted & stored
+    print(f"{total} saves ({len(deleted)} deleted) from {args.processes} processes x {args.threads} threads "
+          f"in {elapsed:.2f}s ({total / elapsed:.0f} saves/s)")
+    print(f"stored: {len(stored)}  expected: {len(kept)}  missing: {len(missing)}  "
+          f"resurrected: {len(resurrected)}  unparseable lines: {torn_lines}  stats total: {stats_total}")
+
+    if missing or resurrected or torn_lines or stats_total != len(stored) or len(kept) + len(deleted) != total:
+        print("FAILED")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Extraction Micro-Benchmark
+Measures per-message cost of candidate field extraction on short and long answers.
+
+Usage:
+    python benchmarks/extraction.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import extract_candidate_fields
+
+SHORT_ANSWER = "Hi, I'm Priya Sharma. I have 6 years of experience as a backend developer in Pune."
+
+LONG_PARAGRAPH = (
+    "In my current role I own the ingestion pipeline, which means a lot of work around "
+    "throughput, back-pressure and making retries idempotent so that replays are safe. "
+    "Most of the services are written in Python with Django and FastAPI, a few in Go, and "
+    "we run everything on Kubernetes with PostgreSQL and Redis behind it. "
+)
+
+
+def bench(label: str, text: str, number: int):
+    seconds = timeit.timeit(lambda: extract_candidate_fields(text), number=number)
+    print(f"{label:<28}{len(text):>8} chars{seconds / number * 1e6:>12.1f} us/message")
+
+
+def main():
+    print(f"{'input':<28}{'size':>14}{'cost':>23}")
+    bench("short answer", SHORT_ANSWER, 5000)
+    bench("pasted answer (x10)", LONG_PARAGRAPH * 10, 500)
+    bench("pasted answer (x100)", LONG_PARAGRAPH * 100, 50)
+
+
+if __name__ == "__main__":
+    main()
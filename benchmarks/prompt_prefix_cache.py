@@ -0,0 +1,152 @@
+"""
+Prompt Prefix Cache Benchmark
+Measures time-to-first-token for the "classic" and "prefix_stable" prompt layouts.
+
+By default a stub OpenAI-compatible server is started that emulates a single-slot
+KV/prefix cache (like LM Studio or llama.cpp): only the part of the prompt that
+differs from the previous request is "processed", at a fixed cost per character.
+Pass --base-url to run the same interview script against a real local server.
+
+Usage:
+    python benchmarks/prompt_prefix_cache.py
+    python benchmarks/prompt_prefix_cache.py --base-url http://127.0.0.1:1234/v1
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import OPENAI_CONFIG, PERFORMANCE_CONFIG
+from chatbot import HiringAssistant
+
+CANDIDATE_TURNS = [
+    "Hi, my name is Priya Sharma",
+    "priya.sharma@example.com",
+    "+91 98765 43210",
+    "I have 6 years of experience",
+    "I'm applying as a backend developer",
+    "I am based in Pune",
+    "Python, Django, PostgreSQL, Docker and AWS",
+    "I usually add retries with exponential backoff and idempotency keys.",
+    "I profile first, then add indexes or caching where the query plan shows full scans.",
+    "We split the monolith by bounded context and used an outbox for events.",
+    "I write tests around the public API and keep mocks at the edges.",
+    "I prefer small PRs and pairing on tricky parts.",
+    "Our hardest project was migrating billing without downtime.",
+    "The trickiest decision was dual writes versus change data capture.",
+    "I like async standups and clear ownership.",
+    "What does the team's on-call rotation look like?",
+]
+
+
+class StubServerState:
+    """Single-slot prefix cache shared by stub request handlers"""
+
+    def __init__(self, cost_per_char: float, reply: str):
+        self.cost_per_char = cost_per_char
+        self.reply = reply
+        self.cached_prompt = ""
+        self.lock = threading.Lock()
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def make_handler(state: StubServerState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            prompt = "".join(f"<{m['role']}>{m['content']}" for m in body["messages"])
+
+            with state.lock:
+                reused = _common_prefix_length(prompt, state.cached_prompt)
+                # Emulate prompt processing for the uncached suffix only
+                time.sleep((len(prompt) - reused) * state.cost_per_char)
+                state.cached_prompt = prompt + f"<assistant>{state.reply}"
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for word in state.reply.split(" "):
+                chunk = {
+                    "id": "stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+
+    return Handler
+
+
+def run_interview(layout: str) -> list:
+    """Run the scripted interview and return per-turn time-to-first-token in ms"""
+    PERFORMANCE_CONFIG["prompt_layout"] = layout
+    # Measure prompt layout only: every turn must reach the model
+    PERFORMANCE_CONFIG["templated_information_gathering"] = False
+    PERFORMANCE_CONFIG["cache_responses"] = False
+    assistant = HiringAssistant()
+    ttfts = []
+
+    for turn in CANDIDATE_TURNS:
+        start = time.perf_counter()
+        stream = assistant.process_message_stream(turn)
+        next(stream)
+        ttfts.append((time.perf_counter() - start) * 1000)
+        for _ in stream:
+            pass
+
+    return ttfts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Real OpenAI-compatible endpoint (default: start a stub server)")
+    parser.add_argument("--cost-per-char-ms", type=float, default=0.02,
+                        help="Stub prompt-processing cost per uncached character, in milliseconds")
+    args = parser.parse_args()
+
+    server = None
+    state = None
+    if args.base_url:
+        OPENAI_CONFIG["base_url"] = args.base_url
+    else:
+        state = StubServerState(args.cost_per_char_ms / 1000, "Great! Could you tell me a bit more about that?")
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        OPENAI_CONFIG["base_url"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    results = {}
+    for layout in ("classic", "prefix_stable"):
+        if state:
+            state.cached_prompt = ""
+        results[layout] = run_interview(layout)
+
+    print(f"{'layout':<15}{'mean TTFT':>12}{'p50':>10}{'last turn':>12}")
+    for layout, ttfts in results.items():
+        print(f"{layout:<15}{statistics.mean(ttfts):>10.1f}ms{statistics.median(ttfts):>8.1f}ms{ttfts[-1]:>10.1f}ms")
+
+    speedup = statistics.mean(results["classic"]) / statistics.mean(results["prefix_stable"])
+    print(f"\nprefix_stable mean TTFT speedup: {speedup:.2f}x")
+
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Response Cache Isolation Check
+Runs two candidates through the same information-gathering script against a fake
+LLM that tailors its replies to whatever the candidate has said. Checks that no
+reply served to the second candidate mentions the first candidate's details, and
+reports how many LLM calls the templates and the response cache saved. Runs with
+the default config; --no-templates sends every turn through the cache instead.
+
+Usage:
+    python benchmarks/response_cache_isolation.py
+    python benchmarks/response_cache_isolation.py --no-templates
+"""
+
+import argparse
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PERFORMANCE_CONFIG
+from chatbot import HiringAssistant
+from response_cache import RESPONSE_CACHE
+
+CANDIDATES = {
+    "A": {
+        "details": ("Priya", "Django", "Python", "Pune"),
+        "script": ["hello", "Hi, my name is Priya Sharma", "priya@example.com", "ok", "+91 98765 43210",
+                   "I have 5 years of experience", "I'm applying for Backend Developer position",
+                   "what does the role involve?", "I live in Pune", "My stack is Python and Django"],
+    },
+    "B": {
+        "details": ("Arjun", "Spring", "Java", "Mumbai"),
+        "script": ["hello", "Hi, my name is Arjun Mehta", "arjun@example.com", "ok", "+91 91234 56789",
+                   "I have 7 years of experience", "I'm applying for Backend Developer position",
+                   "What does the role involve?", "I live in Mumbai", "My stack is Java, Spring Boot"],
+    },
+}
+
+FRAMEWORKS = ("Django", "Spring")
+
+
+class FakeLLM:
+    """OpenAI-shaped client whose replies mention the candidate's stack once it is known"""
+
+    base_url = "http://fake-llm.invalid/v1"
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **params):
+        self.calls += 1
+        conversation = " ".join(str(message["content"]) for message in params["messages"] if message["role"] == "user")
+        framework = next((name for name in FRAMEWORKS if name in conversation), None)
+        if framework:
+            content = f"Thanks! Let's start the technical round: how do you keep {framework} queries efficient?"
+        else:
+            content = "Thanks for that. Could you tell me a little more about yourself?"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def run_candidate(label: str) -> tuple:
+    """Run one candidate's script; returns (replies, LLM calls)"""
+    client = FakeLLM()
+    assistant = HiringAssistant(client=client)
+    replies = [assistant.process_message(message) for message in CANDIDATES[label]["script"]]
+    return replies, client.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--no-templates", action="store_true", help="disable templated information-gathering replies")
+    args = parser.parse_args()
+    if args.no_templates:
+        PERFORMANCE_CONFIG["templated_information_gathering"] = False
+
+    replies_a, calls_a = run_candidate("A")
+    replies_b, calls_b = run_candidate("B")
+
+    leaked = [reply for reply in replies_b
+              if any(detail.lower() in reply.lower() for detail in CANDIDATES["A"]["details"])]
+
+    print(f"Candidate A: {len(replies_a)} turns, {calls_a} LLM calls")
+    print(f"Candidate B: {len(replies_b)} turns, {calls_b} LLM calls")
+    stats = RESPONSE_CACHE.stats()
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
+    print(f"B's last reply: {replies_b[-1]}")
+
+    if leaked:
+        print(f"FAIL: {len(leaked)} of B's replies mention A's details:")
+        for reply in leaked:
+            print(f"  {reply}")
+        sys.exit(1)
+    print("OK: no reply served to B mentions A's details")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Stream Rendering Benchmark
+Compares redrawing a placeholder on every streamed chunk with ThrottledStreamRenderer:
+number of redraws, bytes pushed to the placeholder (what Streamlit sends over the
+websocket) and CPU time per reply.
+
+Usage:
+    python benchmarks/stream_rendering.py
+    python benchmarks/stream_rendering.py --reply-chars 6000 --tokens-per-second 80
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stream_renderer import CURSOR, ThrottledStreamRenderer
+
+
+class CountingPlaceholder:
+    """Stands in for st.empty(): counts redraws and payload bytes"""
+
+    def __init__(self):
+        self.updates = 0
+        self.bytes_sent = 0
+
+    def markdown(self, body: str):
+        self.updates += 1
+        self.bytes_sent += len(body.encode("utf-8"))
+
+
+class FakeClock:
+    """Advances by a fixed step per token so runs are deterministic and fast"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_chunks(reply_chars: int):
+    words = ("Could you walk me through how you would design a rate limiter for an API "
+             "gateway, including storage, eviction and failure handling? ").split(" ")
+    chunks, size, i = [], 0, 0
+    while size < reply_chars:
+        chunk = words[i % len(words)] + " "
+        chunks.append(chunk)
+        size += len(chunk)
+        i += 1
+    return chunks
+
+
+def per_chunk(chunks):
+    placeholder = CountingPlaceholder()
+    start = time.process_time()
+    full_response = ""
+    for chunk in chunks:
+        full_response += chunk
+        placeholder.markdown(full_response + CURSOR)
+    placeholder.markdown(full_response)
+    return placeholder, time.process_time() - start
+
+
+def throttled(chunks, seconds_per_token: float):
+    placeholder = CountingPlaceholder()
+    clock = FakeClock()
+    renderer = ThrottledStreamRenderer(placeholder, clock=clock)
+    start = time.process_time()
+    for chunk in chunks:
+        clock.now += seconds_per_token
+        renderer.write(chunk)
+    renderer.finish()
+    return placeholder, time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reply-chars", type=int, default=3000, help="Length of the streamed reply")
+    parser.add_argument("--tokens-per-second", type=float, default=60, help="Simulated streaming rate")
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.reply_chars)
+    results = {
+        "per-chunk": per_chunk(chunks),
+        "throttled": throttled(chunks, 1 / args.tokens_per_second),
+    }
+
+    print(f"{len(chunks)} chunks, {args.reply_chars} chars at {args.tokens_per_second:.0f} tokens/s\n")
+    print(f"{'renderer':<12}{'redraws':>10}{'bytes sent':>14}{'CPU':>10}")
+    for name, (placeholder, cpu) in results.items():
+        print(f"{name:<12}{placeholder.updates:>10}{placeholder.bytes_sent:>14,}{cpu * 1000:>8.2f}ms")
+
+    before, after = results["per-chunk"][0], results["throttled"][0]
+    print(f"\nwebsocket payload reduced {before.bytes_sent / after.bytes_sent:.1f}x "
+          f"({before.updates} -> {after.updates} redraws)")
+
+
+if __name__ == "__main__":
+    main()
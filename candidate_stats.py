@@ -0,0 +1,220 @@
+"""
+Candidate Statistics
+Running aggregate of candidate statistics, kept in a sidecar file next to the store.
+"""
+
+import heapq
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from config import DATA_CONFIG
+from storage import FileLock
+from utils import extract_years_of_experience
+
+# Experience is bucketed per whole year; sanitize_data caps it at 50
+MAX_EXPERIENCE_YEARS = 50
+PERCENTILES = (25, 50, 75, 90)
+
+
+def parse_experience(value) -> Optional[int]:
+    """Return whole years from an int or an "N years" string, or None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        years = int(value)
+    elif isinstance(value, str):
+        years = int(value) if value.strip().isdigit() else extract_years_of_experience(value)
+        if years is None:
+            return None
+    else:
+        return None
+    return years if 0 <= years <= MAX_EXPERIENCE_YEARS else None
+
+
+def _empty_aggregate() -> Dict:
+    return {
+        "total": 0,
+        "tech_counts": {},
+        "position_counts": {},
+        "experience_histogram": [0] * (MAX_EXPERIENCE_YEARS + 1),
+        "last_updated": None
+    }
+
+
+def _adjust(counts: Dict[str, int], key: str, delta: int):
+    value = counts.get(key, 0) + delta
+    if value > 0:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def _apply_record(aggregate: Dict, record: Dict, sign: int):
+    """Add (sign=1) or subtract (sign=-1) one stored record"""
+    data = record.get('data', {})
+    aggregate["total"] = max(0, aggregate["total"] + sign)
+
+    tech_stack = data.get('tech_stack', [])
+    if isinstance(tech_stack, str):
+        tech_stack = [tech.strip().lower() for tech in tech_stack.split(',') if tech.strip()]
+    for tech in tech_stack:
+        _adjust(aggregate["tech_counts"], tech, sign)
+
+    if data.get('position'):
+        _adjust(aggregate["position_counts"], data['position'], sign)
+
+    years = parse_experience(data.get('experience'))
+    if years is not None:
+        histogram = aggregate["experience_histogram"]
+        histogram[years] = max(0, histogram[years] + sign)
+
+
+def _percentile(histogram: List[int], count: int, pct: int) -> int:
+    """Nearest-rank percentile over the per-year histogram"""
+    rank = max(1, -(-pct * count // 100))
+    seen = 0
+    for years, bucket in enumerate(histogram):
+        seen += bucket
+        if seen >= rank:
+            return years
+    return len(histogram) - 1
+
+
+class StatisticsAggregator:
+    """
+    Keeps tech counts, position counts and an experience histogram up to date as
+    records are saved and deleted, so get_statistics costs the same at any dataset
+    size. Updates are read-modify-write deltas under `<path>.lock`, which keeps several
+    processes sharing one data directory consistent; rebuild() recovers from drift.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the aggregator for the given sidecar file"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{path}.lock")
+        self._aggregate = None
+        self._signature = None
+        self._snapshot = None
+
+    def exists(self) -> bool:
+        """Return True if the sidecar file has been written"""
+        return os.path.exists(self.path)
+
+    def _file_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _load(self) -> Dict:
+        """Return the current aggregate, re-reading the file only when it changed"""
+        signature = self._file_signature()
+        if self._aggregate is not None and signature == self._signature:
+            return self._aggregate
+
+        aggregate = _empty_aggregate()
+        if signature is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    aggregate.update(json.load(f))
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Error loading statistics, run rebuild-stats: {e}")
+        self._aggregate = aggregate
+        self._signature = signature
+        self._snapshot = None
+        return aggregate
+
+    def _save(self, aggregate: Dict):
+        aggregate["last_updated"] = datetime.now().isoformat()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(aggregate, f)
+        os.replace(tmp_path, self.path)
+        self._aggregate = aggregate
+        self._signature = self._file_signature()
+        self._snapshot = None
+
+    def apply(self, added: Iterable[Dict] = (), removed: Iterable[Dict] = ()):
+        """Fold saved and deleted records into the aggregate"""
+        with self._lock:
+            self._file_lock.acquire()
+            try:
+                aggregate = self._load()
+                for record in added:
+                    _apply_record(aggregate, record, 1)
+                for record in removed:
+                    _apply_record(aggregate, record, -1)
+                self._save(aggregate)
+            finally:
+                self._file_lock.release()
+
+    def record_saved(self, records: List[Dict]):
+        """Listener for batches written by the store"""
+        self.apply(added=records)
+
+    def rebuild(self, records: Iterable[Dict]) -> int:
+        """Recompute the aggregate from every stored record; returns the record count"""
+        aggregate = _empty_aggregate()
+        for record in records:
+            _apply_record(aggregate, record, 1)
+
+        with self._lock:
+            self._file_lock.acquire()
+            try:
+                self._save(aggregate)
+            finally:
+                self._file_lock.release()
+        return aggregate["total"]
+
+    def snapshot(self) -> Dict:
+        """Return statistics derived from the aggregate (cached until it changes)"""
+        with self._lock:
+            aggregate = self._load()
+            if self._snapshot is not None:
+                return self._snapshot
+
+            if not aggregate["total"]:
+                self._snapshot = {"total_candidates": 0}
+                return self._snapshot
+
+            histogram = aggregate["experience_histogram"]
+            with_experience = sum(histogram)
+            total_years = sum(years * bucket for years, bucket in enumerate(histogram))
+
+            self._snapshot = {
+                "total_candidates": aggregate["total"],
+                "popular_technologies": dict(heapq.nlargest(
+                    10, aggregate["tech_counts"].items(), key=lambda item: item[1])),
+                "average_experience": total_years / with_experience if with_experience else 0,
+                "experience_percentiles": {
+                    f"p{pct}": _percentile(histogram, with_experience, pct) for pct in PERCENTILES
+                } if with_experience else {},
+                "popular_positions": dict(heapq.nlargest(
+                    5, aggregate["position_counts"].items(), key=lambda item: item[1])),
+                "last_updated": aggregate["last_updated"]
+            }
+            return self._snapshot
+
+
+_lock = threading.Lock()
+_aggregators = {}
+
+
+def statistics_path(store_path: str) -> str:
+    """Sidecar path for a store's aggregate; each store file gets its own"""
+    return store_path + DATA_CONFIG["stats_suffix"]
+
+
+def get_statistics_aggregator(path: str) -> StatisticsAggregator:
+    """Return the process-wide aggregator for a sidecar file"""
+    with _lock:
+        aggregator = _aggregators.get(path)
+        if aggregator is None:
+            aggregator = StatisticsAggregator(path)
+            _aggregators[path] = aggregator
+        return aggregator
@@ -1,17 +1,85 @@
-import openai
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
-from config import OPENAI_CONFIG
+from config import OPENAI_CONFIG, PERFORMANCE_CONFIG, INFORMATION_GATHERING_TEMPLATES, MESSAGE_TEMPLATES
+from extractor import confident_fields, extract_candidate_fields
+from llm_client import get_shared_client, get_shared_async_client
+from response_cache import RESPONSE_CACHE
+from resilience import CircuitOpenError, get_resilient_caller
+
+EMPTY_INPUT_MESSAGE = "I didn't receive any input. Could you please tell me more?"
+
+# Phases whose replies depend only on which fields are still missing, so they can be shared
+CACHEABLE_PHASES = ('greeting', 'information_gathering')
+_WORDS = re.compile(r'\w+')
+
+# Interview rules shared by both prompt layouts; the interview state is added per turn
+SYSTEM_PROMPT_RULES = """You are TalentScout, an expert AI hiring assistant conducting a CONVERSATIONAL technical interview for a software development position.
+
+CRITICAL INFORMATION GATHERING RULE
+You MUST collect ALL required candidate information before proceeding to technical questions.
+
+REQUIRED CANDIDATE INFORMATION (MUST COLLECT ALL):
+- name: Full name of the candidate
+- email: Professional email address  
+- phone: Contact phone number
+- experience: Years of professional experience
+- position: Target role/position applying for
+- location: Current location/availability
+- tech_stack: Programming languages, frameworks, technologies
+
+CONVERSATIONAL INTERVIEW STYLE:
+1. INFORMATION FIRST: If ANY required information is missing, ask for it before technical questions
+2. ONE QUESTION ONLY: Ask exactly ONE question per response - never multiple questions
+3. KEEP IT SHORT: Your responses should be 1-2 sentences maximum
+4. EXPECT SHORT ANSWERS: Candidates should give 30-50 word responses, not essays
+5. BE CONVERSATIONAL: Sound friendly and natural, like chatting with a colleague
+6. BRIEF ACKNOWLEDGMENT: Quick "Great!" or "Perfect!" before next question
+
+TECHNICAL QUESTION GUIDELINES:
+- Ask ONE specific, focused question at a time
+- Make it practical: "How do you handle..." rather than "Explain everything about..."
+- Expect concise answers (30-50 words)
+- Follow up naturally based on their response
+- Avoid complex multi-part questions
+
+CONVERSATION EXAMPLES:
+GOOD: "Great! What's your email address?"
+GOOD: "Perfect! How many years of experience do you have?"
+GOOD: "Nice! How do you usually handle API rate limits?"
+BAD: "Can you tell me about your experience with APIs, error handling, and also your projects?"
+BAD: Asking multiple questions in one response
+BAD: Long responses expecting detailed explanations
+
+REMEMBER: Keep it conversational, ONE question at a time, expect SHORT answers!"""
+
+# Prefix-stable layout: byte-identical on every turn, state follows in the last message
+STATIC_SYSTEM_PROMPT = SYSTEM_PROMPT_RULES + "\nThe latest interview state is provided in the final message before your reply."
+
+class InterviewProgress(NamedTuple):
+    """Immutable view of interview progress; `version` changes whenever any field does"""
+    version: int
+    phase: str
+    phase_index: int
+    total_phases: int
+    collected_fields: Tuple[str, ...]
+    missing_fields: Tuple[str, ...]
+    completion_percentage: float
+    candidate_data: Tuple[Tuple[str, str], ...]
 
 class HiringAssistant:
-    def __init__(self):
-        self.client = openai.OpenAI(
-            base_url=OPENAI_CONFIG["base_url"],
-            api_key=OPENAI_CONFIG["api_key"]
-        )
+    def __init__(self, client=None):
+        # Sessions share the process-wide pooled client unless one is injected
+        self.client = client or self._create_client()
+        # Deadline, retry and circuit-breaker policy shared by all sessions on this endpoint
+        self.resilience = get_resilient_caller(str(self.client.base_url))
         self.conversation_history = []
+        # Wire-format messages kept in step with conversation_history; turns already folded into
+        # the summary are dropped once there are more than max_conversation_length of them
+        self.messages = []
+        # Index in conversation_history of self.messages[0]
+        self.messages_start = 0
         self.current_step = 'greeting'
         self.candidate_data = {}
         self.required_fields = [
@@ -29,9 +97,23 @@ class HiringAssistant:
         self.technical_questions_asked = 0
         self.max_technical_questions = 5
         self.interview_completed = False
+        # Fields extracted from the most recent user turn (its "intent" for response caching)
+        self.last_extracted_fields = ()
+        # The subset of them extraction is sure of; only these turns get a templated reply
+        self.last_confident_fields = ()
+        # Progress snapshot, rebuilt lazily after the phase or candidate data change
+        self.progress_version = 0
+        self._progress = None
+        
+        # Context window tracking: older turns are folded into a rolling summary
+        self.summary_lines = []
+        self.summarized_until = 0
           # Initialize with greeting message
         self._add_to_history('assistant', self.get_greeting())
         
+    def _create_client(self):
+        return get_shared_client()
+        
     def get_greeting(self) -> str:
         return """👋 Hello! Welcome to TalentScout's AI Hiring Assistant!
 
@@ -51,59 +133,36 @@ Let's start by getting to know you better! Could you please tell me your full na
         return 'completed'
 
     def _get_system_prompt(self) -> str:
-        current_phase = self._get_current_phase()
-        missing_info = [field for field in self.required_fields if field not in self.candidate_data]
-        
-        # Build conversational system prompt
-        base_prompt = f"""You are TalentScout, an expert AI hiring assistant conducting a CONVERSATIONAL technical interview for a software development position.
-
-CRITICAL INFORMATION GATHERING RULE
-You MUST collect ALL required candidate information before proceeding to technical questions.
+        # Classic layout: the interview rules with the current state embedded
+        return f"""{SYSTEM_PROMPT_RULES}
 
-REQUIRED CANDIDATE INFORMATION (MUST COLLECT ALL):
-- name: Full name of the candidate
-- email: Professional email address  
-- phone: Contact phone number
-- experience: Years of professional experience
-- position: Target role/position applying for
-- location: Current location/availability
-- tech_stack: Programming languages, frameworks, technologies
+{self._get_state_block(include_details=False)}
+Missing fields to collect: {self._missing_fields()}"""
 
-CURRENT STATUS:
-- Interview Phase: {current_phase}
-- Missing Information: {missing_info}
-- Technical Questions Asked: {self.technical_questions_asked}/{self.max_technical_questions}
+    def _get_static_system_prompt(self) -> str:
+        # Identical on every turn so the server can reuse its cached KV prefix;
+        # volatile values live in the trailing state message instead
+        return STATIC_SYSTEM_PROMPT
 
-CONVERSATIONAL INTERVIEW STYLE:
-1. INFORMATION FIRST: If ANY required information is missing, ask for it before technical questions
-2. ONE QUESTION ONLY: Ask exactly ONE question per response - never multiple questions
-3. KEEP IT SHORT: Your responses should be 1-2 sentences maximum
-4. EXPECT SHORT ANSWERS: Candidates should give 30-50 word responses, not essays
-5. BE CONVERSATIONAL: Sound friendly and natural, like chatting with a colleague
-6. BRIEF ACKNOWLEDGMENT: Quick "Great!" or "Perfect!" before next question
+    def _missing_fields(self) -> List[str]:
+        return [field for field in self.required_fields if field not in self.candidate_data]
 
-TECHNICAL QUESTION GUIDELINES:
-- Ask ONE specific, focused question at a time
-- Make it practical: "How do you handle..." rather than "Explain everything about..."
-- Expect concise answers (30-50 words)
-- Follow up naturally based on their response
-- Avoid complex multi-part questions
-
-CURRENT PHASE FOCUS:
-{self._get_phase_instructions(current_phase)}
-
-CONVERSATION EXAMPLES:
-GOOD: "Great! What's your email address?"
-GOOD: "Perfect! How many years of experience do you have?"
-GOOD: "Nice! How do you usually handle API rate limits?"
-BAD: "Can you tell me about your experience with APIs, error handling, and also your projects?"
-BAD: Asking multiple questions in one response
-BAD: Long responses expecting detailed explanations
-
-REMEMBER: Keep it conversational, ONE question at a time, expect SHORT answers!
-Missing fields to collect: {missing_info}"""
+    def _get_state_block(self, include_details: bool) -> str:
+        current_phase = self._get_current_phase()
+        lines = [
+            "CURRENT STATUS:",
+            f"- Interview Phase: {current_phase}",
+            f"- Missing Information: {self._missing_fields()}",
+            f"- Technical Questions Asked: {self.technical_questions_asked}/{self.max_technical_questions}"
+        ]
+        if include_details:
+            known = ", ".join(f"{k}: {v}" for k, v in self.candidate_data.items()) or "none yet"
+            lines.append(f"- Candidate details collected so far: {known}")
+        lines.extend(["", "CURRENT PHASE FOCUS:", self._get_phase_instructions(current_phase)])
+        return "\n".join(lines)
 
-        return base_prompt
+    def _get_state_message(self) -> Dict:
+        return {"role": PERFORMANCE_CONFIG["state_message_role"], "content": self._get_state_block(include_details=True)}
 
     def _get_phase_instructions(self, phase: str) -> str:
         missing_fields = [field for field in self.required_fields if field not in self.candidate_data]
@@ -164,300 +223,297 @@ Missing fields to collect: {missing_info}"""
         
         return instructions.get(phase, "Continue the interview professionally.")
 
-    def _generate_ai_response(self, user_input: str) -> str:
-        try:
-            # Prepare messages with full conversation history
-            messages = [
-                {"role": "system", "content": self._get_system_prompt()}
-            ]
-            
-            # Add conversation history
-            for msg in self.conversation_history:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
-            
-            # Add current user input
-            messages.append({"role": "user", "content": user_input})
-            
-            # Generate response
-            response = self.client.chat.completions.create(
-                model=OPENAI_CONFIG["model"],
-                messages=messages,
-                temperature=OPENAI_CONFIG["temperature"],
-                max_tokens=OPENAI_CONFIG["max_tokens"]
-            )
-            
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
-            return f"I apologize, but I'm experiencing a technical issue. Could you please repeat your response? (Error: {str(e)})"
+    def _estimate_tokens(self, text: str) -> int:
+        # Rough heuristic (~4 characters per token) so no tokenizer is needed
+        return len(text) // 4 + 1
 
-    def process_message(self, user_input: str) -> str:
+    def _summarize_message(self, msg: Dict) -> str:
+        speaker = "Candidate" if msg["role"] == "user" else "Assistant"
+        content = " ".join(msg["content"].split())
+        if len(content) > 160:
+            content = content[:157] + "..."
+        return f"{speaker}: {content}"
+
+    def _fold_into_summary(self, upto: int):
+        # Move turns that slid out of the verbatim window into the rolling summary
+        while self.summarized_until < upto:
+            self.summary_lines.append(self._summarize_message(self.conversation_history[self.summarized_until]))
+            self.summarized_until += 1
+        
+        # Keep the summary bounded by dropping its oldest lines
+        max_chars = PERFORMANCE_CONFIG["context_summary_max_chars"]
+        while len(self.summary_lines) > 1 and sum(len(line) + 1 for line in self.summary_lines) > max_chars:
+            self.summary_lines.pop(0)
+
+    def _get_summary_message(self, include_details: bool = True) -> Optional[Dict]:
+        if not self.summary_lines:
+            return None
+        
+        content = "Summary of earlier conversation (older turns condensed):\n" + "\n".join(self.summary_lines)
+        known = ", ".join(f"{k}: {v}" for k, v in self.candidate_data.items())
+        if known and include_details:
+            content += f"\nCandidate details collected so far: {known}"
+        return {"role": "system", "content": content}
+
+    def _build_context_messages(self) -> List[Dict]:
+        # System prompt + rolling summary of older turns + last N turns verbatim
+        prefix_stable = PERFORMANCE_CONFIG["prompt_layout"] == "prefix_stable"
+        recent_turns = min(PERFORMANCE_CONFIG["context_recent_turns"], PERFORMANCE_CONFIG["max_conversation_length"])
+        history_length = len(self.conversation_history)
+        
+        if prefix_stable:
+            # Slide the window in chunks so the cached prefix survives several turns
+            window_start = self.summarized_until
+            if history_length - window_start > recent_turns:
+                window_start = history_length - max(1, recent_turns // 2)
+        else:
+            window_start = max(self.summarized_until, history_length - recent_turns)
+        self._fold_into_summary(window_start)
+        
+        if prefix_stable:
+            system_message = {"role": "system", "content": self._get_static_system_prompt()}
+            state_message = self._get_state_message()
+        else:
+            system_message = {"role": "system", "content": self._get_system_prompt()}
+            state_message = None
+        recent = self.messages[window_start - self.messages_start:]
+        
+        # Enforce the token budget by folding the oldest verbatim turns, always keeping the latest one
+        budget = PERFORMANCE_CONFIG["context_token_budget"]
+        recent_tokens = [self._estimate_tokens(msg["content"]) for msg in recent]
+        total = self._estimate_tokens(system_message["content"]) + sum(recent_tokens)
+        if state_message:
+            total += self._estimate_tokens(state_message["content"])
+        summary = self._get_summary_message(include_details=not prefix_stable)
+        if summary:
+            total += self._estimate_tokens(summary["content"])
+        
+        dropped = 0
+        while total > budget and len(recent) - dropped > 1:
+            total -= recent_tokens[dropped]
+            dropped += 1
+        
+        if dropped:
+            self._fold_into_summary(window_start + dropped)
+            recent = recent[dropped:]
+            summary = self._get_summary_message(include_details=not prefix_stable)
+        
+        messages = [system_message]
+        if summary:
+            messages.append(summary)
+        messages.extend(recent)
+        if state_message:
+            messages.append(state_message)
+        return messages
+
+    def _start_turn(self, user_input: str) -> bool:
+        # Shared by sync and async paths: record the user turn and extract information
         if not user_input.strip():
-            return "I didn't receive any input. Could you please tell me more?"
+            return False
         
         # Add user message to history
         self._add_to_history('user', user_input)
         
         # Extract information from user input
         self._simple_extract_information(user_input)
+        return True
+
+    def _completion_params(self, stream: bool = False) -> Dict:
+        # Prepare messages from the bounded context window (already ends with the user turn)
+        params = {
+            "model": OPENAI_CONFIG["model"],
+            "messages": self._build_context_messages(),
+            "temperature": OPENAI_CONFIG["temperature"],
+            "max_tokens": OPENAI_CONFIG["max_tokens"]
+        }
+        if stream:
+            params["stream"] = True
+        return params
+
+    def _templated_response(self) -> Optional[str]:
+        # Rule-driven reply while collecting fields; the LLM handles failed, doubtful
+        # ("yes" read as a name) or off-script turns
+        if not PERFORMANCE_CONFIG["templated_information_gathering"] or not self.last_extracted_fields:
+            return None
+        if self.last_confident_fields != self.last_extracted_fields:
+            return None
+        if self._get_current_phase() not in CACHEABLE_PHASES:
+            return None
         
-        # Generate AI response
-        response = self._generate_ai_response(user_input)
+        missing_info = [field for field in self.required_fields if field not in self.candidate_data]
+        if not missing_info:
+            return None
         
-        # Add assistant response to history
-        self._add_to_history('assistant', response)
+        templates = INFORMATION_GATHERING_TEMPLATES
+        if 'name' in self.last_extracted_fields:
+            acknowledgment = templates["name_acknowledgment"].format(first_name=self.candidate_data['name'].split()[0])
+        else:
+            acknowledgments = templates["acknowledgments"]
+            acknowledgment = acknowledgments[(len(self.conversation_history) // 2) % len(acknowledgments)]
+        
+        return f"{acknowledgment} {templates['questions'][missing_info[0]]}"
+
+    def _get_fast_response(self) -> Optional[str]:
+        # Answers that need no LLM call: templated questions first, then cached replies
+        response = self._templated_response()
+        if response is None:
+            response = self._get_cached_response()
+        return response
+
+    def _response_cache_key(self) -> Optional[tuple]:
+        # Information-gathering turns the templates leave to the LLM: short replies such as
+        # "yes", "hello" or "what's this role?", keyed by the normalized message and the state
+        if not PERFORMANCE_CONFIG["cache_responses"]:
+            return None
+        
+        current_phase = self._get_current_phase()
+        if current_phase not in CACHEABLE_PHASES:
+            return None
+        
+        missing_info = tuple(field for field in self.required_fields if field not in self.candidate_data)
+        # With nothing missing the reply opens the technical round for this candidate's stack
+        if not missing_info:
+            return None
+        
+        words = _WORDS.findall(self.conversation_history[-1]["content"].lower())
+        if not words or len(words) > PERFORMANCE_CONFIG["response_cache_max_input_words"]:
+            return None
+        return (PERFORMANCE_CONFIG["prompt_layout"], current_phase, missing_info,
+                self.last_extracted_fields, " ".join(words))
+
+    def _get_cached_response(self) -> Optional[str]:
+        key = self._response_cache_key()
+        return RESPONSE_CACHE.get(key) if key else None
+
+    def _store_cached_response(self, response: str):
+        key = self._response_cache_key()
+        if not key or not response:
+            return
         
-        # Update interview progress
+        # The key only describes which fields are missing, so a reply that echoes any
+        # collected value (name, stack, experience, ...) is specific to this candidate
+        response_words = set(re.findall(r'\w+', response.lower()))
+        for value in self.candidate_data.values():
+            for word in re.findall(r'\w+', str(value).lower()):
+                if (len(word) >= 2 or word.isdigit()) and word in response_words:
+                    return
+        
+        RESPONSE_CACHE.put(key, response)
+
+    def _finish_turn(self, response: str):
+        # Add assistant response to history and update interview progress
+        self._add_to_history('assistant', response)
         self._update_interview_progress()
+
+    def _error_message(self, error: Exception) -> str:
+        # Fail fast with the neutral fallback while the LLM endpoint is known to be down
+        if isinstance(error, CircuitOpenError):
+            return MESSAGE_TEMPLATES["fallback"].strip()
+        return f"I apologize, but I'm experiencing a technical issue. Could you please repeat your response? (Error: {str(error)})"
+
+    def _generate_ai_response(self, user_input: str) -> str:
+        try:
+            response = self.resilience.call(self.client.chat.completions.create, **self._completion_params())
+            response_text = response.choices[0].message.content.strip()
+            self._store_cached_response(response_text)
+            return response_text
+            
+        except Exception as e:
+            return self._error_message(e)
+
+    def process_message(self, user_input: str) -> str:
+        if not self._start_turn(user_input):
+            return EMPTY_INPUT_MESSAGE
         
+        # Use a templated or cached reply for this interview state, otherwise generate one
+        response = self._get_fast_response()
+        if response is None:
+            response = self._generate_ai_response(user_input)
+        
+        self._finish_turn(response)
         return response
 
     def process_message_stream(self, user_input: str):
-        if not user_input.strip():
-            yield "I didn't receive any input. Could you please tell me more?"
+        if not self._start_turn(user_input):
+            yield EMPTY_INPUT_MESSAGE
             return
         
-        # Add user message to history
-        self._add_to_history('user', user_input)
-        
-        # Extract information
-        self._simple_extract_information(user_input)
+        fast_response = self._get_fast_response()
+        if fast_response is not None:
+            yield fast_response
+            self._finish_turn(fast_response)
+            return
         
         try:
-            # Prepare messages
-            messages = [
-                {"role": "system", "content": self._get_system_prompt()}
-            ]
-            
-            for msg in self.conversation_history:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
-            
-            messages.append({"role": "user", "content": user_input})
-            
             # Stream response
             response_text = ""
-            stream = self.client.chat.completions.create(
-                model=OPENAI_CONFIG["model"],
-                messages=messages,
-                temperature=OPENAI_CONFIG["temperature"],
-                max_tokens=OPENAI_CONFIG["max_tokens"],
-                stream=True
-            )
+            stream = self.resilience.call(self.client.chat.completions.create, **self._completion_params(stream=True))
             
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    chunk_text = chunk.choices[0].delta.content
-                    response_text += chunk_text
-                    yield chunk_text
+            try:
+                for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        chunk_text = chunk.choices[0].delta.content
+                        response_text += chunk_text
+                        yield chunk_text
+            except GeneratorExit:
+                # Abandoned by the caller (e.g. a Streamlit rerun) while the endpoint was answering
+                self.resilience.record_success()
+                raise
+            except Exception as e:
+                self.resilience.record_failure(e)
+                raise
+            else:
+                self.resilience.record_success()
+            finally:
+                # Also runs when the caller abandons the generator, so the pooled connection is always returned
+                stream.close()
             
             # Add complete response to history
-            self._add_to_history('assistant', response_text)
-            self._update_interview_progress()
+            self._store_cached_response(response_text)
+            self._finish_turn(response_text)
             
         except Exception as e:
-            error_msg = f"I apologize, but I'm experiencing a technical issue. Could you please repeat your response? (Error: {str(e)})"
+            error_msg = self._error_message(e)
             yield error_msg
             self._add_to_history('assistant', error_msg)
 
     def _simple_extract_information(self, text: str):
-        text_lower = text.lower()
-        
-        # Enhanced name extraction
-        if not self.candidate_data.get('name'):
-            # Look for "I'm", "my name is", "I am", etc.
-            name_patterns = [
-                r"(?:i'?m|my name is|i am|call me)\s+([a-zA-Z][a-zA-Z\s'-]{1,30}[a-zA-Z])",
-                r"(?:hi|hello),?\s+(?:i'?m|my name is|i am)\s+([a-zA-Z][a-zA-Z\s'-]{1,30}[a-zA-Z])",
-                r"^([a-zA-Z][a-zA-Z\s'-]{1,30}[a-zA-Z])(?:\s+here|\s*$|\s+speaking)"
-            ]
-            
-            for pattern in name_patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    name = match.group(1).strip().title()
-                    if len(name.split()) >= 1 and len(name) >= 2:
-                        self.candidate_data['name'] = name
-                        break
-        
-        # Enhanced email extraction
-        if not self.candidate_data.get('email'):
-            email_match = re.search(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b', text)
-            if email_match:
-                self.candidate_data['email'] = email_match.group()
-        if not self.candidate_data.get('phone'):
-            phone_patterns = [
-                # Indian phone numbers with +91 prefix
-                r'\+91[-\s]?([6-9][0-9]{9})\b',
-                r'\+91[-\s]?([6-9][0-9]{4})[-\s]?([0-9]{5})\b',
-                # Direct +91 format without space
-                r'\b\+91([6-9][0-9]{9})\b',
-                # Indian mobile numbers without country code
-                r'\b([6-9][0-9]{9})\b',
-                r'\b([6-9][0-9]{4})[-\s]?([0-9]{5})\b',
-                # General formats with parentheses or separators
-                r'\(([6-9][0-9]{4})\)[-\s]?([0-9]{5})\b',
-                r'(?<!\+|\d)([6-9][0-9]{4})[-\s]?([0-9]{5})\b'
-            ]
-            
-            for pattern in phone_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    # Standardize phone number format
-                    if '+91' in pattern or '+91' in match.group():
-                        # Format with +91 prefix
-                        if len(match.groups()) == 1:
-                            # Get the 10 digits
-                            digits = match.group(1)
-                            self.candidate_data['phone'] = f"+91 {digits[:5]} {digits[5:]}"
-                        elif len(match.groups()) == 2:
-                            self.candidate_data['phone'] = f"+91 {match.group(1)} {match.group(2)}"
-                    else:
-                        # Add +91 prefix for Indian numbers without it
-                        if len(match.groups()) == 1:
-                            digits = match.group(1)
-                            self.candidate_data['phone'] = f"+91 {digits[:5]} {digits[5:]}"
-                        elif len(match.groups()) == 2:
-                            self.candidate_data['phone'] = f"+91 {match.group(1)} {match.group(2)}"
-                    
-                    # Validation check
-                    phone_without_spaces = self.candidate_data['phone'].replace(' ', '')
-                    if not re.match(r'^\+91[6-9][0-9]{9}$', phone_without_spaces):
-                        # Fallback if format is still incorrect
-                        cleaned_digits = re.sub(r'[^0-9]', '', match.group())
-                        if len(cleaned_digits) == 10 and cleaned_digits[0] in '6789':
-                            self.candidate_data['phone'] = f"+91 {cleaned_digits[:5]} {cleaned_digits[5:]}"
-                    break
-        
-        # Enhanced experience extraction
-        if not self.candidate_data.get('experience'):
-            exp_patterns = [
-                r'(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
-                r'(?:experience|exp).*?(\d+)(?:\+)?\s*(?:years?|yrs?)',
-                r'(?:been\s+(?:working|coding|developing|programming)).*?(\d+)(?:\+)?\s*(?:years?|yrs?)',
-                r'(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:in|as|doing)'
-            ]
-            
-            for pattern in exp_patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    years = match.group(1)
-                    self.candidate_data['experience'] = f"{years} years"
-                    break
-          # Enhanced position extraction - Improved for accuracy
-        if not self.candidate_data.get('position'):
-            position_keywords = [
-                'developer', 'engineer', 'programmer', 'architect', 'analyst',
-                'manager', 'lead', 'senior', 'junior', 'full stack', 'frontend', 'front-end', 'front end',
-                'backend', 'back-end', 'back end', 'software', 'web', 'mobile', 'devops', 'qa', 'tester',
-                'sde', 'data scientist', 'machine learning', 'ml', 'ai', 'cloud', 'security', 'administrator'
-            ]
-            
-            for keyword in position_keywords:
-                if keyword in text_lower:
-                    # Find the surrounding context related to job position
-                    patterns = [
-                        # Direct job title references
-                        rf'\b(?:as\s+(?:a\s+)?|i\'?m\s+(?:a\s+)?|i am\s+(?:a\s+)?|work\s+as\s+(?:a\s+)?|working\s+as\s+(?:a\s+)?)([^.!?]*{keyword}[^.!?]*)',
-                        # Position/role references
-                        rf'\b(?:position|role|job|title)\s+(?:is|as|:)?\s+([^.!?]*{keyword}[^.!?]*)',
-                        # Application references
-                        rf'\b(?:applying\s+for|interested\s+in|looking\s+for)\s+([^.!?]*{keyword}[^.!?]*)'
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, text_lower)
-                        if match:
-                            position = match.group(1).strip()
-                            # Remove location phrases from positions
-                            location_indicators = ['in', 'at', 'from', 'near', 'around']
-                            for indicator in location_indicators:
-                                loc_split = position.split(f" {indicator} ")
-                                if len(loc_split) > 1:
-                                    # Keep only the part before the location indicator
-                                    position = loc_split[0].strip()
-                            
-                            # Limit length and ensure it's position-related
-                            if 3 < len(position) < 50:
-                                self.candidate_data['position'] = position.title()
-                                break
-                    
-                    # If position was found in any pattern, break the keyword loop
-                    if self.candidate_data.get('position'):
-                        break
-          # Enhanced location extraction - Improved for clarity and precision
-        if not self.candidate_data.get('location'):
-            # Common Indian and international locations for candidates
-            common_locations = [
-                'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'kolkata', 
-                'pune', 'ahmedabad', 'noida', 'gurgaon', 'gurugram', 'new delhi', 'kochi', 
-                'chandigarh', 'jaipur', 'indore', 'coimbatore', 'remote', 'work from home', 'wfh',
-                'new york', 'london', 'singapore', 'dubai', 'australia', 'canada', 'usa', 'uk'
-            ]
-            
-            # Check for common locations
-            for loc in common_locations:
-                if loc in text_lower:
-                    if loc == 'wfh':
-                        self.candidate_data['location'] = 'Work From Home'
-                    else:
-                        self.candidate_data['location'] = loc.title()
-                    break
-            
-            # If common location not found, use refined patterns
-            if not self.candidate_data.get('location'):
-                location_patterns = [
-                    # Explicit location statements
-                    r'(?:i am|i\'m|am|currently|presently)\s+(?:from|in|at|living|based|located|residing)\s+(?:in\s+)?([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)',
-                    r'(?:my|current)\s+location\s+(?:is|:)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)',
-                    # Geographic references
-                    r'(?:located|based|living)\s+(?:at|in|near)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)',
-                    # City/region with qualifiers
-                    r'(?:city|town|region|area)\s+(?:of|is|:)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)',
-                    # Remote work statements
-                    r'(?:i|working|available|prefer)\s+(?:to\s+)?(?:work\s+)?(?:remotely|remote\s+work|from\s+home|wfh)'
-                ]
-                
-                for pattern in location_patterns:
-                    match = re.search(pattern, text_lower)
-                    if match:
-                        if 'remote' in pattern or 'from home' in pattern or 'wfh' in pattern:
-                            self.candidate_data['location'] = 'Work From Home'
-                            break
-                            
-                        if match.groups():
-                            location = match.group(1).strip()
-                            # Filter out common filler phrases and ensure reasonable length
-                            filler_words = ['the', 'a', 'an', 'or', 'and', 'but', 'from']
-                            if (len(location) > 2 and 
-                                not all(word in filler_words for word in location.split()) and 
-                                len(location.split()) <= 4):
-                                self.candidate_data['location'] = location.title()
-                                break
-        
-        # Enhanced tech stack extraction
-        if not self.candidate_data.get('tech_stack'):
-            tech_keywords = [
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-                'react', 'angular', 'vue', 'node', 'express', 'spring', 'django', 'flask',
-                'aws', 'azure', 'docker', 'kubernetes', 'jenkins', 'git', 'sql', 'nosql',
-                'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch'
-            ]
-            
-            found_techs = []
-            for tech in tech_keywords:
-                if tech in text_lower:
-                    found_techs.append(tech.title())
-            
-            if found_techs:
-                self.candidate_data['tech_stack'] = ', '.join(found_techs)
+        # Precompiled single-pass extraction; only fills fields not collected yet
+        extracted = extract_candidate_fields(text, self.candidate_data)
+        self.candidate_data.update(extracted)
+        self.last_extracted_fields = tuple(sorted(extracted))
+        self.last_confident_fields = confident_fields(text, extracted)
+        if extracted:
+            self._progress_changed()
+
+    def _progress_changed(self):
+        self.progress_version += 1
+        self._progress = None
+
+    def get_progress(self) -> InterviewProgress:
+        # Cached until the next state change, so callers can compare versions cheaply
+        if self._progress is None:
+            collected = tuple(field for field in self.required_fields if self.candidate_data.get(field))
+            missing = tuple(field for field in self.required_fields if not self.candidate_data.get(field))
+            self._progress = InterviewProgress(
+                version=self.progress_version,
+                phase=self._get_current_phase(),
+                phase_index=self.current_phase_index,
+                total_phases=len(self.interview_phases),
+                collected_fields=collected,
+                missing_fields=missing,
+                completion_percentage=len(collected) / len(self.required_fields) * 100,
+                candidate_data=tuple((field, str(value)) for field, value in self.candidate_data.items() if value)
+            )
+        return self._progress
 
     def _update_interview_progress(self):
+        phase_before = self.current_phase_index
+        self._advance_phase()
+        if self.current_phase_index != phase_before:
+            self._progress_changed()
+
+    def _advance_phase(self):
         missing_info = [field for field in self.required_fields if field not in self.candidate_data]
         
         # If in greeting phase and we have some info, move to information gathering
@@ -483,25 +539,42 @@ Missing fields to collect: {missing_info}"""
             "content": content,
             "timestamp": datetime.now().isoformat()
         })
+        self.messages.append({"role": role, "content": content})
+        self._trim_messages()
+    
+    def _trim_messages(self):
+        # conversation_history stays complete for display and export; only the wire buffer is capped
+        excess = len(self.messages) - PERFORMANCE_CONFIG["max_conversation_length"]
+        droppable = min(excess, self.summarized_until - self.messages_start)
+        if droppable > 0:
+            del self.messages[:droppable]
+            self.messages_start += droppable
         
     def get_conversation_summary(self) -> Dict:
         # Validate required fields are present and correctly formatted
         self._validate_and_normalize_candidate_data()
         
-        missing_fields = [field for field in self.required_fields if field not in self.candidate_data]
+        progress = self.get_progress()
+        missing_fields = list(progress.missing_fields)
         
         return {
             "candidate_data": self.candidate_data,
             "conversation_length": len(self.conversation_history),
-            "current_phase": self._get_current_phase(),
-            "phase_index": self.current_phase_index,
+            "current_phase": progress.phase,
+            "phase_index": progress.phase_index,
             "technical_questions_asked": self.technical_questions_asked,
             "missing_information": missing_fields,
-            "completion_percentage": ((len(self.required_fields) - len(missing_fields)) / len(self.required_fields)) * 100,
+            "completion_percentage": progress.completion_percentage,
             "interview_completed": len(missing_fields) == 0 and self.current_phase_index >= 2
         }
         
     def _validate_and_normalize_candidate_data(self):
+        before = dict(self.candidate_data)
+        self._normalize_candidate_data()
+        if self.candidate_data != before:
+            self._progress_changed()
+
+    def _normalize_candidate_data(self):
         # Ensure phone numbers have +91 prefix for Indian numbers
         if 'phone' in self.candidate_data:
             phone = self.candidate_data['phone']
@@ -611,4 +684,76 @@ Missing fields to collect: {missing_info}"""
                 candidate_info[field] = "[Not Provided]"
             elif not candidate_info[field]:
                 # If field is empty, add placeholder
-                candidate_info[field] = "[Not Provided]"
\ No newline at end of file
+                candidate_info[field] = "[Not Provided]"
+
+
+class AsyncHiringAssistant(HiringAssistant):
+    """
+    Non-blocking variant backed by openai.AsyncOpenAI, so many interviews can share
+    one event loop in a headless service. Extraction, context building and phase
+    logic are inherited unchanged from HiringAssistant.
+    """
+
+    def _create_client(self):
+        return get_shared_async_client()
+
+    async def _generate_ai_response(self, user_input: str) -> str:
+        try:
+            response = await self.resilience.acall(self.client.chat.completions.create, **self._completion_params())
+            response_text = response.choices[0].message.content.strip()
+            self._store_cached_response(response_text)
+            return response_text
+            
+        except Exception as e:
+            return self._error_message(e)
+
+    async def process_message(self, user_input: str) -> str:
+        if not self._start_turn(user_input):
+            return EMPTY_INPUT_MESSAGE
+        
+        response = self._get_fast_response()
+        if response is None:
+            response = await self._generate_ai_response(user_input)
+        
+        self._finish_turn(response)
+        return response
+
+    async def process_message_stream(self, user_input: str):
+        if not self._start_turn(user_input):
+            yield EMPTY_INPUT_MESSAGE
+            return
+        
+        fast_response = self._get_fast_response()
+        if fast_response is not None:
+            yield fast_response
+            self._finish_turn(fast_response)
+            return
+        
+        try:
+            response_text = ""
+            stream = await self.resilience.acall(self.client.chat.completions.create, **self._completion_params(stream=True))
+            
+            try:
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        chunk_text = chunk.choices[0].delta.content
+                        response_text += chunk_text
+                        yield chunk_text
+            except GeneratorExit:
+                self.resilience.record_success()
+                raise
+            except Exception as e:
+                self.resilience.record_failure(e)
+                raise
+            else:
+                self.resilience.record_success()
+            finally:
+                await stream.close()
+            
+            self._store_cached_response(response_text)
+            self._finish_turn(response_text)
+            
+        except Exception as e:
+            error_msg = self._error_message(e)
+            yield error_msg
+            self._add_to_history('assistant', error_msg)
@@ -33,9 +33,21 @@ STREAMLIT_CONFIG = {
 # Data Storage Configuration
 DATA_CONFIG = {
     "data_directory": "data",
-    "candidates_file": "candidates.json",
+    "storage_backend": "jsonl",  # "jsonl" or "sqlite"
+    "sqlite_file": "candidates.db",
+    "candidates_file": "candidates.jsonl",  # One record per line, append-only
+    "legacy_candidates_file": "candidates.json",  # Imported automatically on first run
+    "compaction_min_tombstones": 100,
+    "compaction_tombstone_ratio": 0.25,  # Compact once deletes reach this share of live records
+    "write_behind": True,  # Save from a background writer thread instead of the request path
+    "write_queue_size": 1000,  # Saves block once this many records are waiting
+    "write_batch_size": 100,
+    "write_flush_interval_ms": 50,  # How long the writer waits to coalesce a batch
+    "write_retry_interval_ms": 1000,  # A failed batch is kept and retried this often
     "sessions_file": "sessions.json",
+    "stats_suffix": ".stats.json",  # Running aggregate beside each store (candidates.jsonl.stats.json); rebuild with manage_data.py
     "retention_days": 730,  # 2 years for GDPR compliance
+    "retention_sweep_interval_hours": 24,  # Background expiry sweep per process; 0 disables it
     "max_file_size_mb": 10
 }
 
@@ -54,21 +66,31 @@ CONVERSATION_CONFIG = {
 # Validation Rules
 VALIDATION_RULES = {
     "name": {
+        "required": True,
         "min_length": 2,
         "max_length": 100,
-        "pattern": r'^[a-zA-Z\s\-\'\.]+$'
+        "pattern": r"^(?:[^\W\d_]|[\s\-'.])+$",  # Letters in any script, spaces, - ' .
+        "message": "Name can only contain letters, spaces, hyphens, apostrophes and dots"
     },
     "email": {
-        "pattern": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        "required": True,
+        "pattern": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+        "message": "Invalid email format"
     },
     "phone": {
+        "strip": r'[-.\s\(\)]',  # Separators removed before matching
         "patterns": [
+            r'^\+91[6-9]\d{9}$',  # Indian mobile with +91
+            r'^[6-9]\d{9}$',  # Indian mobile without prefix
+            r'^\+\d{1,3}\d{8,12}$',  # International
             r'^\d{10}$',  # 10 digits
-            r'^\+\d{1,3}\d{10,}$',  # International
             r'^\d{11}$'  # 11 digits
-        ]
+        ],
+        "message": "Invalid phone number format"
     },
     "experience": {
+        "required": True,
+        "type": "years",  # int, or a string such as "5 years"
         "min_value": 0,
         "max_value": 50
     },
@@ -86,22 +108,25 @@ VALIDATION_RULES = {
 TECH_CATEGORIES = {
     "programming_languages": [
         "python", "java", "javascript", "typescript", "c++", "c#", "go", 
-        "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab"
+        "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab",
+        "perl", "objective-c", "shell", "bash", "powershell", "sql", "html", "css"
     ],
     "web_frameworks": [
         "react", "angular", "vue", "django", "flask", "spring", "laravel", 
-        "express", "fastapi", "rails", "asp.net", "nextjs", "nuxt"
+        "express", "fastapi", "rails", "asp.net", "nextjs", "nuxt",
+        "node.js", "gatsby", "svelte", "backbone", "ember", "jquery",
+        "bootstrap", "tailwind", "material-ui", "ant-design"
     ],
     "databases": [
         "mysql", "postgresql", "mongodb", "redis", "elasticsearch", 
-        "cassandra", "dynamodb", "sqlite", "oracle", "sql-server"
+        "cassandra", "dynamodb", "sqlite", "oracle", "sql-server", "nosql"
     ],
     "cloud_platforms": [
         "aws", "azure", "gcp", "heroku", "netlify", "vercel", "digitalocean"
     ],
     "devops_tools": [
         "docker", "kubernetes", "jenkins", "gitlab-ci", "github-actions", 
-        "terraform", "ansible", "chef", "puppet"
+        "terraform", "ansible", "chef", "puppet", "git", "gitlab", "github"
     ],
     "data_science": [
         "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", 
@@ -109,6 +134,32 @@ TECH_CATEGORIES = {
     ]
 }
 
+# Alternate spellings mapped to their canonical technology name
+TECH_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'golang': 'go',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'vuejs': 'vue',
+    'angularjs': 'angular',
+    'next.js': 'nextjs',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'tf': 'terraform',
+    'aws lambda': 'aws',
+    'ec2': 'aws',
+    's3': 'aws',
+    'azure functions': 'azure',
+    'gcp': 'google cloud',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'dl': 'deep learning'
+}
+
 # Technical Questions Database
 TECHNICAL_QUESTIONS = {
     "python": [
@@ -208,6 +259,28 @@ UI_THEME = {
     "border_color": "#4a5568"
 }
 
+# Sidebar labels for interview phases and candidate fields
+INTERVIEW_PHASE_LABELS = {
+    "greeting": "🎯 Greeting",
+    "information_gathering": "📋 Information Gathering",
+    "technical_assessment": "🔧 Technical Assessment",
+    "experience_discussion": "💼 Experience Discussion",
+    "project_deep_dive": "🚀 Project Deep Dive",
+    "cultural_fit": "🤝 Cultural Fit",
+    "candidate_questions": "❓ Your Questions",
+    "next_steps": "✅ Next Steps"
+}
+
+CANDIDATE_FIELD_LABELS = {
+    "name": "📝 **Name:**",
+    "email": "📧 **Email:**",
+    "phone": "📞 **Phone:**",
+    "experience": "⏰ **Experience:**",
+    "position": "💼 **Position:**",
+    "location": "📍 **Location:**",
+    "tech_stack": "⚙️ **Tech Stack:**"
+}
+
 # Message Templates
 MESSAGE_TEMPLATES = {
     "greeting": """
@@ -253,6 +326,21 @@ I'm sorry, I didn't quite understand that. Could you please rephrase your respon
     """
 }
 
+# Templated replies for the information gathering phase (no LLM round trip)
+INFORMATION_GATHERING_TEMPLATES = {
+    "acknowledgments": ["Great!", "Perfect!", "Thanks!", "Got it!"],
+    "name_acknowledgment": "Nice to meet you, {first_name}!",
+    "questions": {
+        "name": "Could you please tell me your full name?",
+        "email": "What's your email address?",
+        "phone": "What's the best phone number to reach you?",
+        "experience": "How many years of professional experience do you have?",
+        "position": "Which position are you applying for?",
+        "location": "Where are you currently located?",
+        "tech_stack": "Which programming languages, frameworks and tools do you work with?"
+    }
+}
+
 # Privacy and Security Settings
 PRIVACY_CONFIG = {
     "data_encryption": True,
@@ -260,15 +348,49 @@ PRIVACY_CONFIG = {
     "gdpr_compliance": True,
     "data_retention_days": 730,
     "consent_required": True,
-    "audit_logging": True
+    "audit_logging": True,
+    # Secret for keyed email/ID digests: hex or text from this env var, else a generated
+    # key file in the data directory. The same key reproduces the same anonymized data.
+    "anonymization_key_env": "TALENTSCOUT_ANONYMIZATION_KEY",
+    "anonymization_key_file": "anonymization.key",
+    "digest_cache_size": 4096  # Recent email digests kept in memory
 }
 
 # Performance Settings
 PERFORMANCE_CONFIG = {
+    # Share LLM replies to short information-gathering messages the templates can't answer
     "cache_responses": True,
-    "max_conversation_length": 50,
-    "response_timeout_seconds": 30,
-    "max_concurrent_sessions": 100
+    "response_cache_max_input_words": 8,
+    # Ask for the next missing field from templates when extraction succeeded
+    "templated_information_gathering": True,
+    "response_cache_max_entries": 512,
+    "response_cache_ttl_seconds": 3600,
+    "max_conversation_length": 50,  # Wire messages kept for the LLM (older ones survive only in the summary); also caps context_recent_turns
+    # Chat UI: most recent messages drawn as chat bubbles; older ones collapse into one cached block
+    "chat_render_window": 20,
+    # Streamed replies redraw at most this often, or once this many new characters are buffered
+    "stream_render_interval_ms": 50,
+    "stream_render_max_pending_chars": 400,
+    "context_recent_turns": 12,  # Messages sent verbatim to the LLM
+    "context_token_budget": 3000,  # Approximate prompt budget for history
+    "context_summary_max_chars": 2000,  # Cap for the rolling summary of older turns
+    # "prefix_stable" keeps the system prompt byte-identical across turns (server KV/prefix
+    # cache friendly) and sends interview state last; "classic" embeds state in the system prompt
+    "prompt_layout": "prefix_stable",
+    # Role of the trailing state message; use "user" for chat templates that reject late system messages
+    "state_message_role": "system",
+    "response_timeout_seconds": 30,  # Deadline per LLM call, including retries
+    "llm_max_attempts": 3,
+    "llm_retry_base_delay_seconds": 0.5,
+    "llm_retry_max_delay_seconds": 4,
+    "circuit_failure_threshold": 5,  # Consecutive failures before failing fast
+    "circuit_reset_timeout_seconds": 30,
+    "max_concurrent_sessions": 100,
+    # Shared LLM connection pool (one per endpoint, reused by every session)
+    "llm_max_connections": 100,
+    "llm_max_keepalive_connections": 20,
+    "llm_keepalive_expiry_seconds": 30,
+    "llm_pool_timeout_seconds": 10
 }
 
 # Logging Configuration
@@ -3,13 +3,20 @@ Data Handler Module
 Manages candidate data storage, validation, and privacy compliance.
 """
 
+import gzip
 import json
 import os
-import re
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
-import hashlib
+from typing import BinaryIO, Dict, Iterable, List, Optional
 import uuid
+from config import DATA_CONFIG
+from storage import open_candidate_store
+from write_behind import WriteBehindStore, get_write_behind_store
+from candidate_stats import get_statistics_aggregator, parse_experience, statistics_path
+from retention import get_retention_sweeper
+from anonymizer import get_anonymizer
+from validation import VALIDATOR
 
 class DataHandler:
     """
@@ -17,46 +24,64 @@ class DataHandler:
     Ensures GDPR compliance and secure data handling.
     """
     
-    def __init__(self, data_dir: str = "data"):
-        """Initialize data handler with storage directory"""
+    def __init__(self, data_dir: str = "data", storage_backend: Optional[str] = None,
+                 start_retention: bool = False):
+        """
+        Initialize data handler with storage directory and backend ("jsonl" or "sqlite").
+        start_retention starts the background retention sweep; only the app turns it on,
+        so maintenance commands never delete records while they run.
+        """
         self.data_dir = data_dir
-        self.candidates_file = os.path.join(data_dir, "candidates.json")
         self.sessions_file = os.path.join(data_dir, "sessions.json")
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
         
+        # Keyed digests for emails and candidate IDs (key from env or data_dir)
+        self.anonymizer = get_anonymizer(data_dir)
+        
+        # Pluggable candidate store; the JSONL backend imports a legacy candidates.json on first run
+        self.storage_backend = storage_backend or DATA_CONFIG["storage_backend"]
+        self.store = open_candidate_store(data_dir, self.storage_backend, DATA_CONFIG)
+        if DATA_CONFIG["write_behind"]:
+            # Saves are queued and written in batches by one shared background thread
+            self.store = get_write_behind_store(
+                self.store,
+                queue_size=DATA_CONFIG["write_queue_size"],
+                batch_size=DATA_CONFIG["write_batch_size"],
+                flush_interval=DATA_CONFIG["write_flush_interval_ms"] / 1000,
+                retry_interval=DATA_CONFIG["write_retry_interval_ms"] / 1000
+            )
+        self.candidates_file = self.store.path
+        
+        # Running statistics; written batches update it from the writer thread
+        self.statistics = get_statistics_aggregator(statistics_path(self.store.path))
+        if isinstance(self.store, WriteBehindStore):
+            self.store.add_listener(self.statistics.record_saved)
+        if not self.statistics.exists():
+            self.statistics.rebuild(self.store.iter_records())
+        
+        # One background retention sweeper per store and process
+        self.retention = get_retention_sweeper(self.store, self.statistics)
+        if start_retention and DATA_CONFIG["retention_sweep_interval_hours"]:
+            self.retention.start(DATA_CONFIG["retention_sweep_interval_hours"] * 3600)
+        
         # Initialize data files if they don't exist
         self._initialize_data_files()
     
     def _initialize_data_files(self):
         """Initialize data files with empty structures"""
-        if not os.path.exists(self.candidates_file):
-            with open(self.candidates_file, 'w') as f:
-                json.dump([], f)
-        
         if not os.path.exists(self.sessions_file):
             with open(self.sessions_file, 'w') as f:
                 json.dump([], f)
     
     def validate_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return VALIDATOR.is_valid('email', email)
     
     def validate_phone(self, phone: str) -> bool:
         """Validate phone number format"""
-        # Remove common separators and spaces
-        cleaned = re.sub(r'[-.\s\(\)]', '', phone)
-        
-        # Check for valid patterns
-        patterns = [
-            r'^\d{10}$',  # 10 digits
-            r'^\+\d{1,3}\d{10,}$',  # International format
-            r'^\d{11}$'  # 11 digits (with country code)
-        ]
-        
-        return any(re.match(pattern, cleaned) for pattern in patterns)
+        return VALIDATOR.is_valid('phone', phone)
     
     def sanitize_data(self, data: Dict) -> Dict:
         """Sanitize and validate candidate data"""
@@ -65,7 +90,7 @@ class DataHandler:
         # Name validation and sanitization
         if 'name' in data:
             name = str(data['name']).strip()
-            if len(name) >= 2 and name.replace(' ', '').isalpha():
+            if VALIDATOR.is_valid('name', name):
                 sanitized['name'] = name.title()
         
         # Email validation
@@ -80,30 +105,29 @@ class DataHandler:
             if self.validate_phone(phone):
                 sanitized['phone'] = phone
         
-        # Experience validation
+        # Experience validation (accepts ints and "N years" strings)
         if 'experience' in data:
-            try:
-                exp = int(data['experience'])
-                if 0 <= exp <= 50:  # Reasonable experience range
-                    sanitized['experience'] = exp
-            except (ValueError, TypeError):
-                pass
+            exp = parse_experience(data['experience'])
+            if exp is not None:
+                sanitized['experience'] = exp
         
         # Position sanitization
         if 'position' in data:
             position = str(data['position']).strip()
-            if len(position) >= 2:
+            if VALIDATOR.is_valid('position', position):
                 sanitized['position'] = position.title()
         
         # Location sanitization
         if 'location' in data:
             location = str(data['location']).strip()
-            if len(location) >= 2:
+            if VALIDATOR.is_valid('location', location):
                 sanitized['location'] = location.title()
         
         # Tech stack validation
         if 'tech_stack' in data:
-            if isinstance(data['tech_stack'], list):
+            if isinstance(data['tech_stack'], str):
+                sanitized['tech_stack'] = [tech.strip().lower() for tech in data['tech_stack'].split(',') if tech.strip()]
+            elif isinstance(data['tech_stack'], list):
                 tech_stack = [str(tech).strip().lower() for tech in data['tech_stack'] if tech]
                 sanitized['tech_stack'] = tech_stack
         
@@ -114,31 +138,38 @@ class DataHandler:
         email = candidate_data.get('email', '')
         timestamp = datetime.now().isoformat()
         
-        # Create hash for anonymization
-        hash_input = f"{email}_{timestamp}".encode('utf-8')
-        candidate_id = hashlib.sha256(hash_input).hexdigest()[:12]
-        
-        return f"CAND_{candidate_id}"
+        # Keyed BLAKE2b digest, so IDs reveal nothing about the email
+        return self.anonymizer.candidate_id(email, timestamp)
     
     def anonymize_data(self, data: Dict) -> Dict:
-        """Anonymize sensitive data for storage"""
-        anonymized = data.copy()
-        
-        # Hash email for privacy
-        if 'email' in anonymized:
-            email_hash = hashlib.sha256(anonymized['email'].encode()).hexdigest()[:16]
-            anonymized['email_hash'] = email_hash
-            del anonymized['email']  # Remove original email
-        
-        # Partially mask phone number
-        if 'phone' in anonymized:
-            phone = str(anonymized['phone'])
-            if len(phone) >= 10:
-                masked = phone[:3] + '*' * (len(phone) - 6) + phone[-3:]
-                anonymized['phone_masked'] = masked
-                del anonymized['phone']  # Remove original phone
+        """Anonymize sensitive data for storage (keyed email hash, masked phone)"""
+        return self.anonymizer.anonymize(data)
+    
+    def sanitize_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Sanitize a batch of candidate dicts (empty results mark rejected entries)"""
+        return [self.sanitize_data(data) for data in batch]
+    
+    def anonymize_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Anonymize a batch of sanitized candidate dicts"""
+        return self.anonymizer.anonymize_batch(batch)
+    
+    def _build_storage_records(self, sanitized_batch: List[Dict], session_id: str = None) -> List[Dict]:
+        """Wrap sanitized candidate data in storage records (IDs, timestamps, retention)"""
+        timestamp = datetime.now().isoformat()
+        retention_date = self._calculate_retention_date()
+        candidate_ids = [self.generate_candidate_id(data) for data in sanitized_batch]
         
-        return anonymized
+        return [
+            {
+                'candidate_id': candidate_id,
+                'session_id': session_id or str(uuid.uuid4()),
+                'timestamp': timestamp,
+                'data': anonymized,
+                'data_retention_date': retention_date,
+                'consent_given': True  # In real app, this would be explicit
+            }
+            for candidate_id, anonymized in zip(candidate_ids, self.anonymize_batch(sanitized_batch))
+        ]
     
     def save_candidate_data(self, candidate_data: Dict, session_id: str = None) -> str:
         """Save candidate data with privacy compliance"""
@@ -149,42 +180,111 @@ class DataHandler:
             if not sanitized_data:
                 raise ValueError("No valid data to save")
             
-            # Generate candidate ID
-            candidate_id = self.generate_candidate_id(sanitized_data)
-            
             # Prepare data for storage
-            storage_data = {
-                'candidate_id': candidate_id,
-                'session_id': session_id or str(uuid.uuid4()),
-                'timestamp': datetime.now().isoformat(),
-                'data': self.anonymize_data(sanitized_data),
-                'data_retention_date': self._calculate_retention_date(),
-                'consent_given': True  # In real app, this would be explicit
-            }
-            
-            # Load existing candidates
-            candidates = self._load_candidates()
+            storage_data = self._build_storage_records([sanitized_data], session_id)[0]
             
-            # Add new candidate
-            candidates.append(storage_data)
+            # Append one line (queued when write-behind is on); existing records are not re-read
+            self.store.append(storage_data)
+            if not isinstance(self.store, WriteBehindStore):
+                self.statistics.record_saved([storage_data])
             
-            # Save to file
-            with open(self.candidates_file, 'w') as f:
-                json.dump(candidates, f, indent=2, default=str)
-            
-            return candidate_id
+            return storage_data['candidate_id']
         
         except Exception as e:
             print(f"Error saving candidate data: {e}")
             return None
     
-    def _load_candidates(self) -> List[Dict]:
-        """Load candidates from storage"""
+    def _write_batch(self, records: List[Dict]):
+        """Write a batch synchronously and fold it into the statistics"""
+        if isinstance(self.store, WriteBehindStore):
+            self.store.write_now(records)  # statistics listener runs here
+        else:
+            self.store.append_many(records)
+            self.store.sync()
+            self.statistics.record_saved(records)
+    
+    def bulk_import(self, records: Iterable[Dict], batch_size: int = 1000) -> Dict:
+        """
+        Import records in batches with constant memory. Exported storage records
+        (with candidate_id and data) are kept as-is unless the ID already exists; raw
+        candidate dicts are sanitized and anonymized like save_candidate_data.
+        Returns {"imported", "skipped", "rejected", "seconds"}.
+        """
+        start = time.perf_counter()
+        report = {"imported": 0, "skipped": 0, "rejected": 0}
+        stored_batch, raw_batch = [], []
+        
+        def flush_raw():
+            sanitized = [data for data in self.sanitize_batch(raw_batch) if data]
+            report["rejected"] += len(raw_batch) - len(sanitized)
+            stored_batch.extend(self._build_storage_records(sanitized))
+            raw_batch.clear()
+        
+        def flush_stored():
+            if stored_batch:
+                self._write_batch(stored_batch)
+                report["imported"] += len(stored_batch)
+                stored_batch.clear()
+        
+        seen_ids = set()
+        for record in records:
+            if not isinstance(record, dict):
+                report["rejected"] += 1
+                continue
+            if 'candidate_id' in record and isinstance(record.get('data'), dict):
+                candidate_id = record['candidate_id']
+                if candidate_id in seen_ids or self.store.get(candidate_id) is not None:
+                    report["skipped"] += 1
+                    continue
+                seen_ids.add(candidate_id)
+                stored_batch.append(record)
+            else:
+                raw_batch.append(record)
+                if len(raw_batch) >= batch_size:
+                    flush_raw()
+            
+            if len(stored_batch) >= batch_size:
+                flush_stored()
+            if len(seen_ids) >= batch_size * 10:
+                seen_ids.clear()  # IDs from earlier batches are in the store by now
+        
+        flush_raw()
+        flush_stored()
+        report["seconds"] = time.perf_counter() - start
+        return report
+    
+    def bulk_export(self, stream: BinaryIO, compress: bool = False, batch_size: int = 1000) -> int:
+        """Stream every stored record to a binary stream as NDJSON (optionally gzipped); returns the count"""
+        out = gzip.GzipFile(fileobj=stream, mode='wb') if compress else stream
+        exported = 0
+        lines = []
         try:
-            with open(self.candidates_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            for record in self.store.iter_records():
+                lines.append(json.dumps(record, default=str).encode('utf-8') + b'\n')
+                if len(lines) >= batch_size:
+                    out.write(b''.join(lines))
+                    exported += len(lines)
+                    lines = []
+            if lines:
+                out.write(b''.join(lines))
+                exported += len(lines)
+        finally:
+            if compress:
+                out.close()  # Writes the gzip trailer; leaves the underlying stream open
+        return exported
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued saves are on disk. Returns False on timeout or while a failed
+        batch is still waiting to be retried (the cause is in self.store.last_error).
+        """
+        if hasattr(self.store, 'flush'):
+            return self.store.flush(timeout)
+        return True
+    
+    def _load_candidates(self) -> List[Dict]:
+        """Load candidates from storage (served from the store's in-memory index)"""
+        return list(self.store.iter_records())
     
     def _calculate_retention_date(self) -> str:
         """Calculate data retention date (GDPR compliance - 2 years)"""
@@ -194,58 +294,38 @@ class DataHandler:
     
     def get_candidate_data(self, candidate_id: str) -> Optional[Dict]:
         """Retrieve candidate data by ID"""
-        candidates = self._load_candidates()
-        
-        for candidate in candidates:
-            if candidate.get('candidate_id') == candidate_id:
-                return candidate
-        
-        return None
+        return self.store.get(candidate_id)
+    
+    def get_candidates_by_session(self, session_id: str) -> List[Dict]:
+        """Retrieve all candidate records saved during a session"""
+        return self.store.get_by_session(session_id)
     
     def delete_candidate_data(self, candidate_id: str) -> bool:
         """Delete candidate data (GDPR right to be forgotten)"""
         try:
-            candidates = self._load_candidates()
-            
-            # Filter out the candidate to delete
-            updated_candidates = [
-                c for c in candidates 
-                if c.get('candidate_id') != candidate_id
-            ]
-            
-            if len(updated_candidates) < len(candidates):
-                # Save updated list
-                with open(self.candidates_file, 'w') as f:
-                    json.dump(updated_candidates, f, indent=2, default=str)
-                return True
-            
-            return False
+            # Appends a tombstone; the store compacts itself periodically
+            record = self.store.get(candidate_id)
+            if record is None or not self.store.delete(candidate_id):
+                return False
+            self.statistics.apply(removed=[record])
+            return True
         
         except Exception as e:
             print(f"Error deleting candidate data: {e}")
             return False
     
-    def cleanup_expired_data(self):
-        """Clean up expired data based on retention policy"""
+    def cleanup_expired_data(self) -> Optional[Dict]:
+        """Clean up expired data based on retention policy; returns the sweep report"""
         try:
-            candidates = self._load_candidates()
-            current_time = datetime.now()
-            
-            # Filter out expired data
-            valid_candidates = []
-            for candidate in candidates:
-                retention_date = datetime.fromisoformat(candidate.get('data_retention_date', ''))
-                if retention_date > current_time:
-                    valid_candidates.append(candidate)
-            
-            # Save cleaned data
-            with open(self.candidates_file, 'w') as f:
-                json.dump(valid_candidates, f, indent=2, default=str)
+            report = self.retention.sweep()
             
-            print(f"Cleaned up {len(candidates) - len(valid_candidates)} expired records")
+            print(f"Cleaned up {report['expired']} expired records "
+                  f"(scanned {report['scanned']} in {report['seconds']:.2f}s)")
+            return report
         
         except Exception as e:
             print(f"Error during data cleanup: {e}")
+            return None
     
     def export_candidate_data(self, candidate_id: str) -> Optional[str]:
         """Export candidate data in JSON format (GDPR data portability)"""
@@ -258,37 +338,10 @@ class DataHandler:
     
     def get_statistics(self) -> Dict:
         """Get anonymized statistics about candidates"""
-        candidates = self._load_candidates()
-        
-        if not candidates:
-            return {"total_candidates": 0}
-        
-        # Calculate statistics
-        tech_stacks = []
-        experience_levels = []
-        positions = []
-        
-        for candidate in candidates:
-            data = candidate.get('data', {})
-            
-            if 'tech_stack' in data:
-                tech_stacks.extend(data['tech_stack'])
-            
-            if 'experience' in data:
-                experience_levels.append(data['experience'])
-            
-            if 'position' in data:
-                positions.append(data['position'])
-        
-        # Count occurrences
-        from collections import Counter
-        
-        stats = {
-            "total_candidates": len(candidates),
-            "popular_technologies": dict(Counter(tech_stacks).most_common(10)),
-            "average_experience": sum(experience_levels) / len(experience_levels) if experience_levels else 0,
-            "popular_positions": dict(Counter(positions).most_common(5)),
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        return stats
+        # Read pending saves' stats too; the aggregate itself is O(1) to query
+        self.flush()
+        return self.statistics.snapshot()
+    
+    def rebuild_statistics(self) -> int:
+        """Recompute statistics from every stored record; returns the record count"""
+        return self.statistics.rebuild(self.store.iter_records())
@@ -0,0 +1,276 @@
+"""
+Candidate Information Extractor
+Precompiled, single-pass extraction of candidate fields from free-text answers.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from tech_matcher import TECH_MATCHER
+from validation import VALIDATOR
+
+# All patterns are compiled once at import time; keyword lists are folded into
+# alternation regexes so each message is scanned once per field.
+
+# (pattern, has an explicit "my name is" / "I'm" cue)
+_NAME_PATTERNS = tuple((re.compile(p), explicit) for p, explicit in (
+    (r"(?:i'?m|my name is|i am|call me)\s+([a-zA-Z][a-zA-Z\s'-]{1,30}[a-zA-Z])", True),
+    (r"(?:hi|hello),?\s+(?:i'?m|my name is|i am)\s+([a-zA-Z][a-zA-Z\s'-]{1,30}[a-zA-Z])", True),
+    # Bare answer such as "Priya Sharma"; also matches "yes" or "sounds good", hence the stop words
+    (r"^([a-zA-Z][a-zA-Z\s'-]{1,30}?[a-zA-Z])(?:\s+here|\s+speaking|\s*$)", False)
+))
+# Words that never appear in a name: greetings, replies, fillers and "I'm a developer"-style phrases
+NAME_STOP_WORDS = frozenset((
+    'hi', 'hello', 'hey', 'there', 'yes', 'yeah', 'yep', 'no', 'nope', 'not', 'ok', 'okay',
+    'sure', 'fine', 'good', 'great', 'cool', 'nice', 'thanks', 'thank', 'you', 'please',
+    'sounds', 'ready', 'start', 'lets', "let's", 'go', 'am', 'is', 'are', 'me', 'my', 'i',
+    'a', 'an', 'the', 'and', 'or', 'to', 'so', 'here', 'what', 'why', 'how', 'who',
+    'interested', 'looking', 'applying', 'working', 'based', 'from', 'in', 'at', 'with',
+    'currently', 'happy', 'excited', 'doing', 'well', 'bye', 'goodbye', 'done', 'maybe'
+))
+
+_EMAIL_PATTERN = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+
+# (pattern, has explicit +91 prefix)
+_PHONE_PATTERNS = tuple((re.compile(p), '+91' in p) for p in (
+    # Indian phone numbers with +91 prefix
+    r'\+91[-\s]?([6-9][0-9]{9})\b',
+    r'\+91[-\s]?([6-9][0-9]{4})[-\s]?([0-9]{5})\b',
+    # Direct +91 format without space
+    r'\b\+91([6-9][0-9]{9})\b',
+    # Indian mobile numbers without country code
+    r'\b([6-9][0-9]{9})\b',
+    r'\b([6-9][0-9]{4})[-\s]?([0-9]{5})\b',
+    # General formats with parentheses or separators
+    r'\(([6-9][0-9]{4})\)[-\s]?([0-9]{5})\b',
+    r'(?<!\+|\d)([6-9][0-9]{4})[-\s]?([0-9]{5})\b'
+))
+_DIGIT_RUN = re.compile(r'\d{5}')
+_INDIAN_PHONE = re.compile(r'^\+91[6-9][0-9]{9}$')
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+_EXPERIENCE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
+    r'(?:experience|exp).*?(\d+)(?:\+)?\s*(?:years?|yrs?)',
+    r'(?:been\s+(?:working|coding|developing|programming)).*?(\d+)(?:\+)?\s*(?:years?|yrs?)',
+    r'(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:in|as|doing)'
+))
+
+POSITION_KEYWORDS = [
+    'developer', 'engineer', 'programmer', 'architect', 'analyst',
+    'manager', 'lead', 'senior', 'junior', 'full stack', 'frontend', 'front-end', 'front end',
+    'backend', 'back-end', 'back end', 'software', 'web', 'mobile', 'devops', 'qa', 'tester',
+    'sde', 'data scientist', 'machine learning', 'ml', 'ai', 'cloud', 'security', 'administrator'
+]
+_POSITION_ALTERNATION = '|'.join(re.escape(k) for k in POSITION_KEYWORDS)
+_POSITION_KEYWORD = re.compile(_POSITION_ALTERNATION)
+_POSITION_PATTERNS = tuple(re.compile(p) for p in (
+    # Direct job title references
+    rf'\b(?:as\s+(?:a\s+)?|i\'?m\s+(?:a\s+)?|i am\s+(?:a\s+)?|work\s+as\s+(?:a\s+)?|working\s+as\s+(?:a\s+)?)([^.!?]*(?:{_POSITION_ALTERNATION})[^.!?]*)',
+    # Position/role references
+    rf'\b(?:position|role|job|title)\s+(?:is|as|:)?\s+([^.!?]*(?:{_POSITION_ALTERNATION})[^.!?]*)',
+    # Application references
+    rf'\b(?:applying\s+for|interested\s+in|looking\s+for)\s+([^.!?]*(?:{_POSITION_ALTERNATION})[^.!?]*)'
+))
+_POSITION_LOCATION_SPLIT = re.compile(r' (?:in|at|from|near|around) ')
+
+# Common Indian and international locations for candidates, in priority order
+COMMON_LOCATIONS = [
+    'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'kolkata',
+    'pune', 'ahmedabad', 'noida', 'gurgaon', 'gurugram', 'new delhi', 'kochi',
+    'chandigarh', 'jaipur', 'indore', 'coimbatore', 'remote', 'work from home', 'wfh',
+    'new york', 'london', 'singapore', 'dubai', 'australia', 'canada', 'usa', 'uk'
+]
+_LOCATION_PRIORITY = {loc: i for i, loc in enumerate(COMMON_LOCATIONS)}
+_SINGLE_WORD_LOCATIONS = frozenset(loc for loc in COMMON_LOCATIONS if ' ' not in loc)
+_MULTI_WORD_LOCATIONS = tuple(loc for loc in COMMON_LOCATIONS if ' ' in loc)
+# Locations are matched on whole words so "usa" no longer matches inside "usage"
+_WORD = re.compile(r'[a-z]+')
+
+# (pattern, is a remote-work statement)
+_LOCATION_PATTERNS = tuple((re.compile(p), is_remote) for p, is_remote in (
+    # Explicit location statements
+    (r'(?:i am|i\'m|am|currently|presently)\s+(?:from|in|at|living|based|located|residing)\s+(?:in\s+)?([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)', False),
+    (r'(?:my|current)\s+location\s+(?:is|:)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)', False),
+    # Geographic references
+    (r'(?:located|based|living)\s+(?:at|in|near)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)', False),
+    # City/region with qualifiers
+    (r'(?:city|town|region|area)\s+(?:of|is|:)\s+([A-Za-z\s,.-]+?)(?:\s*[.!?]|$|,)', False),
+    # Remote work statements
+    (r'(?:i|working|available|prefer)\s+(?:to\s+)?(?:work\s+)?(?:remotely|remote\s+work|from\s+home|wfh)', True)
+))
+_LOCATION_FILLER_WORDS = frozenset(['the', 'a', 'an', 'or', 'and', 'but', 'from'])
+
+def _format_indian_phone(digits: str) -> str:
+    return f"+91 {digits[:5]} {digits[5:]}"
+
+
+def _match_name(text_lower: str) -> Optional[Tuple[str, bool]]:
+    for pattern, explicit in _NAME_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            name = match.group(1).strip()
+            words = name.split()
+            if len(name) >= 2 and words and not NAME_STOP_WORDS.intersection(words):
+                return name.title(), explicit
+    return None
+
+
+def extract_name(text_lower: str) -> Optional[str]:
+    """Extract the candidate's name from lower-cased text"""
+    match = _match_name(text_lower)
+    return match[0] if match else None
+
+
+def confident_fields(text: str, extracted: Dict) -> Tuple[str, ...]:
+    """
+    Fields of `extracted` safe to act on without the LLM: values that pass VALIDATOR,
+    and for names also an explicit cue or a bare answer of two to four words
+    """
+    confident = []
+    for field, value in extracted.items():
+        if not VALIDATOR.is_valid(field, value):
+            continue
+        if field == 'name':
+            match = _match_name(text.lower())
+            if not match or not (match[1] or 2 <= len(value.split()) <= 4):
+                continue
+        confident.append(field)
+    return tuple(sorted(confident))
+
+
+def extract_email(text: str) -> Optional[str]:
+    """Extract the first email address from text"""
+    if '@' not in text:
+        return None
+    match = _EMAIL_PATTERN.search(text)
+    return match.group() if match else None
+
+
+def extract_phone(text: str) -> Optional[str]:
+    """Extract an Indian phone number formatted as '+91 XXXXX XXXXX'"""
+    # Every pattern needs a run of at least five digits
+    if not _DIGIT_RUN.search(text):
+        return None
+    for pattern, _ in _PHONE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            groups = match.groups()
+            phone = None
+            if len(groups) == 1:
+                phone = _format_indian_phone(groups[0])
+            elif len(groups) == 2:
+                phone = f"+91 {groups[0]} {groups[1]}"
+
+            # Fallback if format is still incorrect
+            if phone is None or not _INDIAN_PHONE.match(phone.replace(' ', '')):
+                cleaned_digits = _NON_DIGITS.sub('', match.group())
+                if len(cleaned_digits) == 10 and cleaned_digits[0] in '6789':
+                    phone = _format_indian_phone(cleaned_digits)
+            return phone
+    return None
+
+
+def extract_experience(text_lower: str) -> Optional[str]:
+    """Extract years of experience as 'N years'"""
+    # Every pattern needs "year(s)" or "yr(s)"
+    if 'year' not in text_lower and 'yr' not in text_lower:
+        return None
+    for pattern in _EXPERIENCE_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            return f"{match.group(1)} years"
+    return None
+
+
+def extract_position(text_lower: str) -> Optional[str]:
+    """Extract the target position from lower-cased text"""
+    if not _POSITION_KEYWORD.search(text_lower):
+        return None
+
+    for pattern in _POSITION_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            # Keep only the part before any location phrase
+            position = _POSITION_LOCATION_SPLIT.split(match.group(1).strip(), 1)[0].strip()
+            # Limit length and ensure it's position-related
+            if 3 < len(position) < 50:
+                return position.title()
+    return None
+
+
+def extract_location(text_lower: str) -> Optional[str]:
+    """Extract the candidate's location from lower-cased text"""
+    # Tokenize once; single words are a set intersection, phrases a substring check on the joined words
+    words = _WORD.findall(text_lower)
+    candidates = set(_SINGLE_WORD_LOCATIONS.intersection(words))
+    joined = f" {' '.join(words)} "
+    candidates.update(loc for loc in _MULTI_WORD_LOCATIONS if f" {loc} " in joined)
+    best = min((_LOCATION_PRIORITY[loc] for loc in candidates), default=len(COMMON_LOCATIONS))
+    if best < len(COMMON_LOCATIONS):
+        loc = COMMON_LOCATIONS[best]
+        return 'Work From Home' if loc == 'wfh' else loc.title()
+
+    for pattern, is_remote in _LOCATION_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            if is_remote:
+                return 'Work From Home'
+
+            location = match.group(1).strip()
+            # Filter out common filler phrases and ensure reasonable length
+            words = location.split()
+            if (len(location) > 2 and
+                not all(word in _LOCATION_FILLER_WORDS for word in words) and
+                len(words) <= 4):
+                return location.title()
+    return None
+
+
+def extract_tech_stack(text_lower: str) -> List[str]:
+    """Extract mentioned technologies in order of first appearance"""
+    return TECH_MATCHER.find(text_lower)
+
+
+def extract_candidate_fields(text: str, known: Optional[Dict] = None) -> Dict:
+    """Extract candidate fields from one message, skipping fields already known"""
+    known = known or {}
+    text_lower = text.lower()
+    extracted = {}
+
+    if not known.get('name'):
+        name = extract_name(text_lower)
+        if name:
+            extracted['name'] = name
+
+    if not known.get('email'):
+        email = extract_email(text)
+        if email:
+            extracted['email'] = email
+
+    if not known.get('phone'):
+        phone = extract_phone(text)
+        if phone:
+            extracted['phone'] = phone
+
+    if not known.get('experience'):
+        experience = extract_experience(text_lower)
+        if experience:
+            extracted['experience'] = experience
+
+    if not known.get('position'):
+        position = extract_position(text_lower)
+        if position:
+            extracted['position'] = position
+
+    if not known.get('location'):
+        location = extract_location(text_lower)
+        if location:
+            extracted['location'] = location
+
+    if not known.get('tech_stack'):
+        techs = extract_tech_stack(text_lower)
+        if techs:
+            extracted['tech_stack'] = ', '.join(tech.title() for tech in techs)
+
+    return extracted
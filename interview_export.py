@@ -0,0 +1,89 @@
+"""
+Interview Export
+Builds the interview export document and serializes it incrementally into a byte stream.
+"""
+
+import gzip
+import io
+import json
+from datetime import datetime
+from typing import BinaryIO, Dict, Optional
+
+EXPORT_VERSION = '2.1'
+
+# iterencode yields many tiny fragments; they are joined into chunks of about this size before writing
+WRITE_CHUNK_CHARS = 64 * 1024
+
+
+def build_interview_export(chatbot, candidate_data: Dict, exported_at: Optional[str] = None) -> Dict:
+    """Assemble the export document; the conversation is referenced, not copied"""
+    summary = chatbot.get_conversation_summary()
+    history = getattr(chatbot, 'conversation_history', [])
+    total_messages = len(history)
+
+    return {
+        'export_metadata': {
+            'exported_at': exported_at or datetime.now().isoformat(),
+            'export_version': EXPORT_VERSION,
+            'interview_system': 'TalentScout AI Hiring Assistant'
+        },
+        'candidate_information': candidate_data,
+        'interview_summary': {
+            'current_phase': summary.get('current_phase', 'Unknown'),
+            'phase_index': summary.get('phase_index', 0),
+            'completion_percentage': summary.get('completion_percentage', 0),
+            'interview_completed': summary.get('interview_completed', False),
+            'missing_information': summary.get('missing_information', [])
+        },
+        # The only copy of the transcript; readers that want speaker/message pairs derive them from this
+        'full_conversation': history,
+        'interview_analysis': {
+            'information_completeness': summary.get('completion_percentage', 0),
+            'engagement_level': min(100, total_messages * 3),
+            'total_messages': total_messages,
+            'estimated_duration': f"{total_messages * 0.5:.1f} minutes",
+            'phases_covered': summary.get('phase_index', 0) + 1
+        }
+    }
+
+
+def write_export(document: Dict, stream: BinaryIO, compact: bool = False, compress: bool = False) -> int:
+    """Serialize a document to a binary stream without building the full JSON string; returns the uncompressed byte count"""
+    if compact:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+
+    out = gzip.GzipFile(fileobj=stream, mode='wb') if compress else stream
+    written = 0
+    pending = []
+    pending_chars = 0
+    try:
+        for fragment in encoder.iterencode(document):
+            pending.append(fragment)
+            pending_chars += len(fragment)
+            if pending_chars >= WRITE_CHUNK_CHARS:
+                written += out.write(''.join(pending).encode('utf-8'))
+                pending = []
+                pending_chars = 0
+        if pending:
+            written += out.write(''.join(pending).encode('utf-8'))
+    finally:
+        if compress:
+            out.close()  # Writes the gzip trailer; leaves the underlying stream open
+    return written
+
+
+def export_to_buffer(document: Dict, compact: bool = False, compress: bool = False) -> io.BytesIO:
+    """Serialize a document into a rewound in-memory buffer, ready for a download button"""
+    buffer = io.BytesIO()
+    write_export(document, buffer, compact=compact, compress=compress)
+    buffer.seek(0)
+    return buffer
+
+
+def export_file_name(candidate_data: Dict, compress: bool = False) -> str:
+    """File name the interview reader recognizes (interview_*.json or .json.gz)"""
+    name = str(candidate_data.get('name', 'candidate')).replace(' ', '_')
+    suffix = '.json.gz' if compress else '.json'
+    return f"interview_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}"
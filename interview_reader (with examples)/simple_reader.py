@@ -3,6 +3,7 @@ Simple Interview Conversation Reader - A minimal tool to read interview conversa
 """
 
 import os
+import gzip
 import json
 import sys
 from flask import Flask, render_template, request, flash, redirect, url_for
@@ -21,9 +22,10 @@ def format_timestamp(timestamp_str):
         return timestamp_str or ""
 
 def load_interview(file_path):
-    """Load interview data from JSON file"""
+    """Load interview data from JSON file (plain or gzip-compressed)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        opener = gzip.open if file_path.lower().endswith(".gz") else open
+        with opener(file_path, 'rt', encoding='utf-8') as f:
             data = json.load(f)
         return data
     except Exception as e:
@@ -35,7 +37,7 @@ def find_interview_files(directory=DEFAULT_EXPORTS_DIR):
     interview_files = []
     
     for filename in os.listdir(directory):
-        if filename.lower().startswith("interview_") and filename.lower().endswith(".json"):
+        if filename.lower().startswith("interview_") and filename.lower().endswith((".json", ".json.gz")):
             file_path = os.path.join(directory, filename)
             if os.path.isfile(file_path):
                 interview_files.append({
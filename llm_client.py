@@ -0,0 +1,242 @@
+"""
+LLM Client Registry
+Process-wide OpenAI clients with keep-alive connection pooling shared by all sessions.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+import openai
+
+from config import OPENAI_CONFIG, PERFORMANCE_CONFIG
+
+
+class PoolStats:
+    """Thread-safe request, pool-timeout and connection wait counters for one shared client"""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.pool_timeouts = 0
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_wait(self, wait_seconds: float):
+        with self._lock:
+            self.waits += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.pool_timeouts += 1
+
+    def snapshot(self, in_use: int, idle: int) -> Dict:
+        with self._lock:
+            return {
+                "max_connections": self.max_connections,
+                "in_use": in_use,
+                "idle": idle,
+                "requests": self.requests,
+                "pool_timeouts": self.pool_timeouts,
+                "avg_wait_ms": (self.total_wait_seconds / self.waits * 1000) if self.waits else 0.0,
+                "max_wait_ms": self.max_wait_seconds * 1000
+            }
+
+
+def _count_connections(transport) -> tuple:
+    # httpcore keeps its connections on the pool; not part of httpx's public API
+    pool = getattr(transport, "_pool", None)
+    connections = list(getattr(pool, "connections", [])) if pool else []
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return len(connections) - idle, idle
+
+
+# httpcore trace events fired once a request has a connection and starts writing to it
+_REQUEST_SENT_EVENTS = frozenset(("http11.send_request_headers.started", "http2.send_request_headers.started"))
+
+
+def _wait_tracer(request: httpx.Request, stats: PoolStats):
+    # Time from handle_request entry to the first byte sent: waiting for a pooled
+    # connection, plus connecting when a new one is opened
+    start = time.perf_counter()
+    previous = request.extensions.get("trace")
+    recorded = []
+
+    def on_event(event: str) -> bool:
+        if not recorded and event in _REQUEST_SENT_EVENTS:
+            recorded.append(True)
+            stats.record_wait(time.perf_counter() - start)
+        return previous is not None
+
+    def trace(event: str, info: Dict):
+        if on_event(event):
+            previous(event, info)
+
+    async def atrace(event: str, info: Dict):
+        if on_event(event):
+            await previous(event, info)
+
+    return trace, atrace
+
+
+def _with_pool_timeout(request: httpx.Request, pool_timeout: float):
+    # The SDK sends its own per-request timeout; cap only the wait for a free connection
+    timeout = dict(request.extensions.get("timeout", {}))
+    timeout["pool"] = pool_timeout
+    request.extensions["timeout"] = timeout
+
+
+class _PooledTransport(httpx.HTTPTransport):
+    """
+    HTTP transport that bounds the wait for a pooled connection and counts requests
+    and wait time (via httpcore's trace extension, so the response stream is not wrapped).
+    The connection limit itself is httpx's (see _pool_limits); a connection goes back
+    to the pool when its response is closed.
+    """
+
+    def __init__(self, stats: PoolStats, pool_timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self._pool_timeout = pool_timeout
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.record_request()
+        request.extensions["trace"] = _wait_tracer(request, self.stats)[0]
+        _with_pool_timeout(request, self._pool_timeout)
+        try:
+            return super().handle_request(request)
+        except httpx.PoolTimeout:
+            self.stats.record_timeout()
+            raise
+
+
+class _PooledAsyncTransport(httpx.AsyncHTTPTransport):
+    """Async HTTP transport that bounds the wait for a pooled connection and counts requests and wait time"""
+
+    def __init__(self, stats: PoolStats, pool_timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self._pool_timeout = pool_timeout
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats.record_request()
+        request.extensions["trace"] = _wait_tracer(request, self.stats)[1]
+        _with_pool_timeout(request, self._pool_timeout)
+        try:
+            return await super().handle_async_request(request)
+        except httpx.PoolTimeout:
+            self.stats.record_timeout()
+            raise
+
+
+_lock = threading.Lock()
+_clients = {}
+_transports = {}
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=PERFORMANCE_CONFIG["llm_max_connections"],
+        max_keepalive_connections=PERFORMANCE_CONFIG["llm_max_keepalive_connections"],
+        keepalive_expiry=PERFORMANCE_CONFIG["llm_keepalive_expiry_seconds"]
+    )
+
+
+def _get_or_create(kind: str, base_url: Optional[str], api_key: Optional[str]):
+    base_url = base_url or OPENAI_CONFIG["base_url"]
+    api_key = api_key or OPENAI_CONFIG["api_key"]
+    key = (kind, base_url, api_key)
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            stats = PoolStats(PERFORMANCE_CONFIG["llm_max_connections"])
+            pool_timeout = PERFORMANCE_CONFIG["llm_pool_timeout_seconds"]
+            if kind == "async":
+                transport = _PooledAsyncTransport(stats, pool_timeout, limits=_pool_limits())
+                # Retries are handled by resilience.ResilientCaller, not the SDK
+                client = openai.AsyncOpenAI(
+                    base_url=base_url, api_key=api_key, max_retries=0,
+                    http_client=httpx.AsyncClient(transport=transport)
+                )
+            else:
+                transport = _PooledTransport(stats, pool_timeout, limits=_pool_limits())
+                client = openai.OpenAI(
+                    base_url=base_url, api_key=api_key, max_retries=0,
+                    http_client=httpx.Client(transport=transport)
+                )
+            _clients[key] = client
+            _transports[key] = transport
+        return client
+
+
+def get_shared_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> openai.OpenAI:
+    """Return the process-wide pooled client for an endpoint, creating it on first use"""
+    return _get_or_create("sync", base_url, api_key)
+
+
+def get_shared_async_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> openai.AsyncOpenAI:
+    """Return the process-wide pooled async client for an endpoint (use from a single event loop)"""
+    return _get_or_create("async", base_url, api_key)
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """Return connection pool statistics for every shared client, keyed by 'kind base_url'"""
+    with _lock:
+        items = list(_transports.items())
+    return {
+        f"{kind} {base_url}": transport.stats.snapshot(*_count_connections(transport))
+        for (kind, base_url, _), transport in items
+    }
+
+
+def _take_clients(kind: str) -> list:
+    with _lock:
+        keys = [key for key in _clients if key[0] == kind]
+        clients = [_clients.pop(key) for key in keys]
+        for key in keys:
+            del _transports[key]
+    return clients
+
+
+async def aclose_shared_clients():
+    """Close pooled async clients and their transports; call from the event loop that used them"""
+    for client in _take_clients("async"):
+        await client.close()
+
+
+async def _close_orphaned_async_clients():
+    for client in _take_clients("async"):
+        try:
+            await client.close()
+        except RuntimeError:
+            # Connections bound to an event loop that has already closed; the pool is
+            # marked closed and the sockets go with that loop's transports
+            pass
+
+
+def close_shared_clients():
+    """Close every pooled client (called automatically at interpreter exit)"""
+    for client in _take_clients("sync"):
+        client.close()
+
+    # Async clients not closed by aclose_shared_clients(): their loop is usually gone by
+    # now, so close them on a fresh one (inside a running loop, use aclose_shared_clients)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_close_orphaned_async_clients())
+
+
+atexit.register(close_shared_clients)
@@ -0,0 +1,114 @@
+"""
+Data Management CLI
+Maintenance commands for candidate storage.
+
+Usage:
+    python manage_data.py migrate data/candidates.json --backend sqlite
+    python manage_data.py rebuild-stats
+    python manage_data.py export candidates.ndjson.gz
+    python manage_data.py import candidates.ndjson.gz
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from candidate_stats import get_statistics_aggregator, statistics_path
+from config import DATA_CONFIG
+from data_handler import DataHandler
+from storage import iter_ndjson_file, migrate_records, open_candidate_store, read_records_file
+
+
+def _rebuild_stats(store) -> int:
+    aggregator = get_statistics_aggregator(statistics_path(store.path))
+    return aggregator.rebuild(store.iter_records())
+
+
+def cmd_migrate(args) -> int:
+    """Import a candidates.json (or .jsonl) file into the target backend"""
+    target = open_candidate_store(args.data_dir, args.backend, DATA_CONFIG)
+    start = time.perf_counter()
+    migrated = migrate_records(read_records_file(args.source), target, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    _rebuild_stats(target)
+    target.close()
+    print(f"Migrated {migrated} records from {args.source} into {args.backend} store {target.path} in {elapsed:.2f}s")
+    return 0
+
+
+def cmd_rebuild_stats(args) -> int:
+    """Recompute the running statistics from every stored record"""
+    store = open_candidate_store(args.data_dir, args.backend, DATA_CONFIG)
+    start = time.perf_counter()
+    total = _rebuild_stats(store)
+    elapsed = time.perf_counter() - start
+    store.close()
+    print(f"Rebuilt statistics from {total} records in {elapsed:.2f}s")
+    return 0
+
+
+def cmd_export(args) -> int:
+    """Stream every record to an NDJSON file (gzip when --gzip or the name ends in .gz)"""
+    handler = DataHandler(args.data_dir, storage_backend=args.backend)
+    compress = args.gzip or args.destination.endswith(".gz")
+    start = time.perf_counter()
+    with open(args.destination, "wb") as f:
+        exported = handler.bulk_export(f, compress=compress, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(args.destination) / (1024 * 1024)
+    print(f"Exported {exported} records to {args.destination} ({size_mb:.1f} MB) in {elapsed:.2f}s "
+          f"({exported / elapsed if elapsed else 0:.0f} records/s)")
+    return 0
+
+
+def cmd_import(args) -> int:
+    """Import an NDJSON (optionally gzipped) file of stored records or raw candidate data"""
+    handler = DataHandler(args.data_dir, storage_backend=args.backend)
+    report = handler.bulk_import(iter_ndjson_file(args.source), batch_size=args.batch_size)
+    seconds = report["seconds"]
+    print(f"Imported {report['imported']} records from {args.source} in {seconds:.2f}s "
+          f"({report['imported'] / seconds if seconds else 0:.0f} records/s); "
+          f"skipped {report['skipped']} existing, rejected {report['rejected']} invalid")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="TalentScout candidate data management")
+    parser.add_argument("--data-dir", default=DATA_CONFIG["data_directory"], help="Data directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser("migrate", help="Import existing candidate records into a storage backend")
+    migrate.add_argument("source", help="Path to candidates.json (JSON array) or a JSON Lines file")
+    migrate.add_argument("--backend", choices=["jsonl", "sqlite"], default="sqlite", help="Target backend")
+    migrate.add_argument("--batch-size", type=int, default=500, help="Records per write transaction")
+    migrate.set_defaults(func=cmd_migrate)
+
+    rebuild = subparsers.add_parser("rebuild-stats", help="Recompute running statistics from stored records")
+    rebuild.add_argument("--backend", choices=["jsonl", "sqlite"], default=DATA_CONFIG["storage_backend"],
+                         help="Backend holding the records")
+    rebuild.set_defaults(func=cmd_rebuild_stats)
+
+    export = subparsers.add_parser("export", help="Stream all candidate records to an NDJSON file")
+    export.add_argument("destination", help="Output path (.gz enables compression)")
+    export.add_argument("--gzip", action="store_true", help="Gzip the output")
+    export.add_argument("--backend", choices=["jsonl", "sqlite"], default=DATA_CONFIG["storage_backend"])
+    export.add_argument("--batch-size", type=int, default=1000, help="Records per write")
+    export.set_defaults(func=cmd_export)
+
+    bulk_import = subparsers.add_parser("import", help="Bulk-import an NDJSON or NDJSON.gz file")
+    bulk_import.add_argument("source", help="File produced by export, or raw candidate dicts one per line")
+    bulk_import.add_argument("--backend", choices=["jsonl", "sqlite"], default=DATA_CONFIG["storage_backend"])
+    bulk_import.add_argument("--batch-size", type=int, default=1000, help="Records per write batch")
+    bulk_import.set_defaults(func=cmd_import)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
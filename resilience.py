@@ -0,0 +1,231 @@
+"""
+Resilient LLM Calls
+Per-call deadlines, jittered retries for transient errors and a circuit breaker.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Dict
+
+import openai
+
+from config import PERFORMANCE_CONFIG
+
+# Errors worth retrying: the server may recover on the next attempt
+TRANSIENT_ERRORS = (
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the LLM while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker. After `failure_threshold` consecutive
+    failures calls fail fast for `reset_timeout` seconds, then a single trial call
+    decides whether to close again. A trial that never reports back within
+    `reset_timeout` counts as a failure, so a lost outcome cannot wedge the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """Initialize a closed breaker"""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _open(self, now: float):
+        if self._state != "open":
+            self.times_opened += 1
+        self._state = "open"
+        self._opened_at = now
+        self._trial_in_flight = False
+
+    def _current_state(self) -> str:
+        now = time.monotonic()
+        if self._state == "half_open" and self._trial_in_flight and now - self._trial_started_at >= self.reset_timeout:
+            self._open(now)
+        if self._state == "open" and now - self._opened_at >= self.reset_timeout:
+            self._state = "half_open"
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed"""
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                self._trial_started_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == "half_open" or self._failures >= self.failure_threshold:
+                self._open(time.monotonic())
+
+
+class ResilientCaller:
+    """Wraps LLM calls with a deadline, jittered exponential backoff and a circuit breaker"""
+
+    def __init__(self, breaker: CircuitBreaker, timeout: float, max_attempts: int,
+                 base_delay: float, max_delay: float):
+        """Initialize the caller with its policy"""
+        self.breaker = breaker
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._metrics = {
+            "calls": 0, "attempts": 0, "retries": 0, "successes": 0,
+            "failures": 0, "timeouts": 0, "short_circuited": 0
+        }
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._metrics[name] += amount
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": uniform in [0, min(max_delay, base * 2^attempt)]
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _before_call(self) -> float:
+        self._count("calls")
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpenError("LLM circuit breaker is open")
+        return time.monotonic() + self.timeout
+
+    def _should_retry(self, error: Exception, attempt: int, deadline: float, delay: float) -> bool:
+        if isinstance(error, openai.APITimeoutError):
+            self._count("timeouts")
+        if not isinstance(error, TRANSIENT_ERRORS) or attempt + 1 >= self.max_attempts:
+            return False
+        return time.monotonic() + delay < deadline
+
+    def _record_failure(self, error: Exception):
+        self._count("failures")
+        if isinstance(error, TRANSIENT_ERRORS):
+            self.breaker.record_failure()
+        else:
+            # A 400 or context-length error means the endpoint answered; only this request was bad
+            self.breaker.record_success()
+
+    def record_success(self):
+        """Mark a call (e.g. a fully consumed stream) as successful"""
+        self._count("successes")
+        self.breaker.record_success()
+
+    def record_failure(self, error: Exception):
+        """Mark a call that failed after it was handed back (e.g. mid-stream)"""
+        if isinstance(error, openai.APITimeoutError):
+            self._count("timeouts")
+        self._record_failure(error)
+
+    def call(self, func: Callable, **params):
+        """Call func(**params, timeout=remaining) with retries; raises the last error"""
+        deadline = self._before_call()
+        attempt = 0
+        while True:
+            self._count("attempts")
+            try:
+                result = func(timeout=max(0.001, deadline - time.monotonic()), **params)
+            except Exception as e:
+                delay = self._backoff(attempt)
+                if not self._should_retry(e, attempt, deadline, delay):
+                    self._record_failure(e)
+                    raise
+                self._count("retries")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if not params.get("stream"):
+                self.record_success()
+            return result
+
+    async def acall(self, func: Callable, **params):
+        """Async counterpart of call() for coroutine functions"""
+        deadline = self._before_call()
+        attempt = 0
+        while True:
+            self._count("attempts")
+            try:
+                result = await func(timeout=max(0.001, deadline - time.monotonic()), **params)
+            except Exception as e:
+                delay = self._backoff(attempt)
+                if not self._should_retry(e, attempt, deadline, delay):
+                    self._record_failure(e)
+                    raise
+                self._count("retries")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if not params.get("stream"):
+                self.record_success()
+            return result
+
+    def stats(self) -> Dict:
+        """Return retry and breaker metrics"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["breaker_state"] = self.breaker.state
+        metrics["breaker_opened"] = self.breaker.times_opened
+        return metrics
+
+
+_lock = threading.Lock()
+_callers = {}
+
+
+def get_resilient_caller(endpoint: str) -> ResilientCaller:
+    """Return the process-wide caller (and breaker) for an endpoint"""
+    with _lock:
+        caller = _callers.get(endpoint)
+        if caller is None:
+            caller = ResilientCaller(
+                CircuitBreaker(
+                    failure_threshold=PERFORMANCE_CONFIG["circuit_failure_threshold"],
+                    reset_timeout=PERFORMANCE_CONFIG["circuit_reset_timeout_seconds"]
+                ),
+                timeout=PERFORMANCE_CONFIG["response_timeout_seconds"],
+                max_attempts=PERFORMANCE_CONFIG["llm_max_attempts"],
+                base_delay=PERFORMANCE_CONFIG["llm_retry_base_delay_seconds"],
+                max_delay=PERFORMANCE_CONFIG["llm_retry_max_delay_seconds"]
+            )
+            _callers[endpoint] = caller
+        return caller
+
+
+def get_resilience_stats() -> Dict[str, Dict]:
+    """Return metrics for every endpoint caller"""
+    with _lock:
+        items = list(_callers.items())
+    return {endpoint: caller.stats() for endpoint, caller in items}
@@ -0,0 +1,86 @@
+"""
+Response Cache
+Bounded LRU/TTL cache for assistant turns that depend only on interview state.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from config import PERFORMANCE_CONFIG
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry expiry, shared by all sessions in the process.
+    Memory is bounded by the entry count and a per-entry size limit.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600, max_entry_chars: int = 2000):
+        """Initialize an empty cache with the given bounds"""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_entry_chars = max_entry_chars
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: str) -> bool:
+        """Store a response; returns False if it is too large to cache"""
+        if len(value) > self.max_entry_chars:
+            return False
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+# Process-wide cache shared by every HiringAssistant
+RESPONSE_CACHE = ResponseCache(
+    max_entries=PERFORMANCE_CONFIG["response_cache_max_entries"],
+    ttl_seconds=PERFORMANCE_CONFIG["response_cache_ttl_seconds"]
+)
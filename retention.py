@@ -0,0 +1,100 @@
+"""
+Retention Sweeper
+Deletes candidate records past their retention date, on demand or on a schedule.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from candidate_stats import StatisticsAggregator
+from storage import CandidateStore
+
+
+class RetentionSweeper:
+    """
+    Runs the store's streaming retention sweep and keeps the running statistics in step.
+    start() repeats the sweep every `interval_seconds` on a daemon thread.
+    """
+
+    def __init__(self, store: CandidateStore, statistics: Optional[StatisticsAggregator] = None,
+                 stats_batch_size: int = 500):
+        """Initialize the sweeper for a store"""
+        self.store = store
+        self.statistics = statistics
+        self.stats_batch_size = stats_batch_size
+        self.last_report = None
+        self._sweep_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sweep(self, now: Optional[datetime] = None) -> Dict:
+        """Delete expired records; returns {"scanned", "expired", "seconds", "finished_at"}"""
+        removed: List[Dict] = []
+
+        def on_expired(record: Dict):
+            # Subtract from the statistics in batches so memory stays bounded
+            removed.append(record)
+            if len(removed) >= self.stats_batch_size:
+                self.statistics.apply(removed=removed)
+                removed.clear()
+
+        with self._sweep_lock:
+            start = time.perf_counter()
+            counts = self.store.delete_expired(
+                (now or datetime.now()).isoformat(),
+                on_expired=on_expired if self.statistics else None
+            )
+            if removed:
+                self.statistics.apply(removed=removed)
+
+            self.last_report = {
+                "scanned": counts["scanned"],
+                "expired": counts["expired"],
+                "seconds": time.perf_counter() - start,
+                "finished_at": datetime.now().isoformat()
+            }
+            return self.last_report
+
+    def _run(self, interval_seconds: float):
+        while True:
+            try:
+                report = self.sweep()
+                if report["expired"]:
+                    print(f"Retention sweep removed {report['expired']} of {report['scanned']} records "
+                          f"in {report['seconds']:.2f}s")
+            except Exception as e:
+                print(f"Error during scheduled retention sweep: {e}")
+            if self._stop.wait(interval_seconds):
+                return
+
+    def start(self, interval_seconds: float):
+        """Sweep now and then every interval_seconds in the background (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval_seconds,),
+                                        name=f"retention-sweeper:{self.store.path}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scheduled sweeps"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+
+_lock = threading.Lock()
+_sweepers = {}
+
+
+def get_retention_sweeper(store: CandidateStore, statistics: Optional[StatisticsAggregator] = None) -> RetentionSweeper:
+    """Return the process-wide sweeper for store.path"""
+    with _lock:
+        sweeper = _sweepers.get(store.path)
+        if sweeper is None:
+            sweeper = RetentionSweeper(store, statistics)
+            _sweepers[store.path] = sweeper
+        return sweeper
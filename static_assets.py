@@ -0,0 +1,58 @@
+"""
+Static Assets
+Process-wide cache for static files and the HTML built from them.
+"""
+
+import os
+
+import streamlit as st
+
+from config import get_config
+
+# Static HTML, built once per process (app.py itself is re-executed on every rerun)
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🤖 TalentScout AI</h1>
+    <p>Intelligent Hiring Assistant for Technology Placements</p>
+</div>
+"""
+
+INFO_CARDS_HTML = tuple(
+    f"""
+<div class="info-card">
+    <h3>{title}</h3>
+    <p>{body}</p>
+</div>
+"""
+    for title, body in (
+        ("🎯 Purpose", "Our AI assistant guides you through initial screening, gathering information and assessing technical skills."),
+        ("⏱️ Duration", "Interview typically takes 10-15 minutes, depending on your responses and background."),
+        ("🔒 Privacy", "Your information is handled securely in compliance with data privacy standards."),
+    )
+)
+
+# Reload edited assets without restarting in development; read once per process in production
+RELOAD_ON_CHANGE = get_config()["debug"]
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _read_text(path: str, mtime_ns) -> str:
+    # mtime_ns is part of the cache key only, so an edited file gets a fresh entry
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _style_block(css: str) -> str:
+    return f"<style>\n{css}\n</style>"
+
+
+def read_static_text(path: str) -> str:
+    """Return a static file's contents, shared by every session in the process"""
+    mtime_ns = os.stat(path).st_mtime_ns if RELOAD_ON_CHANGE else None
+    return _read_text(path, mtime_ns)
+
+
+def get_css_html(path: str = "static/styles.css") -> str:
+    """Return the <style> block for a stylesheet"""
+    return _style_block(read_static_text(path))
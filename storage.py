@@ -0,0 +1,544 @@
+"""
+Candidate Storage
+Pluggable storage backends for candidate records: append-only JSON Lines and SQLite.
+"""
+
+import copy
+import gzip
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Marker key for delete records ("tombstones") appended instead of rewriting the file
+TOMBSTONE_KEY = "_deleted"
+
+
+class FileLock:
+    """
+    Exclusive inter-process lock held on a side file (flock on POSIX, msvcrt on Windows).
+    Every process writing the same store serializes through it.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the lock for the given lock-file path"""
+        self.path = path
+        self._fd = None
+
+    def acquire(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after ~10s; keep waiting
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+class CandidateStore:
+    """Interface every candidate storage backend implements"""
+
+    def append(self, record: Dict):
+        """Append a single record"""
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict]):
+        """Append several records in one write"""
+        raise NotImplementedError
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield live records in insertion order"""
+        raise NotImplementedError
+
+    def get(self, candidate_id: str) -> Optional[Dict]:
+        """Return the record for candidate_id, if present"""
+        raise NotImplementedError
+
+    def get_by_session(self, session_id: str) -> List[Dict]:
+        """Return the records saved for a session, oldest first"""
+        return [record for record in self.iter_records() if record.get('session_id') == session_id]
+
+    def delete(self, candidate_id: str) -> bool:
+        """Delete a record; returns True if it existed"""
+        raise NotImplementedError
+
+    def delete_expired(self, now_iso: str, on_expired: Optional[Callable[[Dict], None]] = None) -> Dict[str, int]:
+        """
+        Delete records whose data_retention_date is not after now_iso. Records without a
+        valid date are kept. Calls on_expired(record) for each deleted record and returns
+        {"scanned": ..., "expired": ...}.
+        """
+        raise NotImplementedError
+
+    def replace_all(self, records: Iterable[Dict]):
+        """Atomically replace the store contents"""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Return the number of live records"""
+        return sum(1 for _ in self.iter_records())
+
+    def sync(self):
+        """Force appended records to stable storage"""
+
+    def close(self):
+        """Release any resources held by the store"""
+
+
+def _is_expired(record: Dict, current_time: datetime) -> bool:
+    """True if the record's retention date has passed; missing or invalid dates never expire"""
+    try:
+        return datetime.fromisoformat(record['data_retention_date']) <= current_time
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+class JSONLCandidateStore(CandidateStore):
+    """
+    Stores one candidate record per line. Saves append a single line (O(1));
+    deletes append a tombstone and the file is compacted once tombstones pile up.
+
+    Reads are served from an in-memory index (by candidate_id and by session) that is
+    rebuilt only when the file's (mtime, size, inode) signature changes behind our back.
+    Records returned by reads are shared with the index and must be treated as read-only.
+
+    Writers in any thread or process serialize on `<path>.lock`, so a compaction never
+    drops a line appended concurrently, and rewrites go to a temp file that is fsynced and
+    renamed into place, so a crash leaves either the old or the new file.
+    """
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None,
+                 compaction_min_tombstones: int = 100, compaction_tombstone_ratio: float = 0.25):
+        """Initialize the store, importing a legacy JSON array file on first use"""
+        self.path = path
+        self.compaction_min_tombstones = compaction_min_tombstones
+        self.compaction_tombstone_ratio = compaction_tombstone_ratio
+
+        # In-memory index; `generation` increases every time its contents change
+        self._index_lock = threading.RLock()
+        self._by_id: Dict[str, Dict] = {}
+        self._by_session: Dict[str, List[str]] = {}
+        self._tombstones = 0
+        self._signature = None
+        self.generation = 0
+
+        self._file_lock = FileLock(f"{path}.lock")
+        self._lock_depth = 0
+
+        with self._locked():
+            if not os.path.exists(self.path):
+                self._import_legacy(legacy_json_path)
+
+    def _import_legacy(self, legacy_json_path: Optional[str]):
+        """Create the JSONL file, carrying over records from an old candidates.json"""
+        records = []
+        if legacy_json_path and os.path.exists(legacy_json_path):
+            try:
+                with open(legacy_json_path, 'r') as f:
+                    records = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                records = []
+        self._write_all(records)
+
+    def _read_lines(self) -> Iterator[Dict]:
+        """Yield every parsed line, skipping blank or torn lines"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    @contextmanager
+    def _locked(self):
+        """Hold the index lock and the inter-process file lock (re-entrant per store)"""
+        with self._index_lock:
+            if self._lock_depth == 0:
+                self._file_lock.acquire()
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    self._file_lock.release()
+
+    def _file_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _apply_entry(self, entry: Dict):
+        """Fold one parsed line (record or tombstone) into the index"""
+        if TOMBSTONE_KEY in entry:
+            self._tombstones += 1
+            self._drop(entry[TOMBSTONE_KEY])
+            return
+
+        candidate_id = entry.get('candidate_id')
+        if candidate_id in self._by_id:
+            # A re-saved id replaces the earlier record, as in the SQLite backend
+            self._drop(candidate_id)
+        self._by_id[candidate_id] = entry
+        self._by_session.setdefault(entry.get('session_id'), []).append(candidate_id)
+
+    def _drop(self, candidate_id: str):
+        record = self._by_id.pop(candidate_id, None)
+        if record is None:
+            return
+        session_ids = self._by_session.get(record.get('session_id'))
+        if session_ids:
+            session_ids.remove(candidate_id)
+            if not session_ids:
+                del self._by_session[record.get('session_id')]
+
+    def _ensure_index(self):
+        """Rebuild the index if the file changed since it was last read"""
+        signature = self._file_signature()
+        if signature is not None and signature == self._signature:
+            return
+
+        self._by_id = {}
+        self._by_session = {}
+        self._tombstones = 0
+        for entry in self._read_lines():
+            self._apply_entry(entry)
+        self._signature = signature
+        self.generation += 1
+
+    def _invalidate(self):
+        with self._index_lock:
+            self._signature = None
+
+    def _write_all(self, records: Iterable[Dict]):
+        """Rewrite the file with the given live records (used by compaction)"""
+        with self._locked():
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._invalidate()
+
+    def append_many(self, records: List[Dict]):
+        """Append several records with one write"""
+        payload = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+        with self._locked():
+            before = self._signature if self._signature == self._file_signature() else None
+            with open(self.path, 'a+b') as f:
+                # Terminate a line torn by an earlier crash so this write starts cleanly
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        payload = '\n' + payload
+                encoded = payload.encode('utf-8')
+                f.write(encoded)
+
+            # Update the index in place unless the file changed since it was last indexed
+            after = self._file_signature()
+            if before is not None and after is not None and after[1] == before[1] + len(encoded):
+                for line in payload.splitlines():
+                    if line:
+                        self._apply_entry(json.loads(line))
+                self._signature = after
+                self.generation += 1
+            else:
+                self._signature = None
+
+    def sync(self):
+        """fsync the data file so earlier appends survive a power loss"""
+        with open(self.path, 'rb') as f:
+            os.fsync(f.fileno())
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield copies of live records in insertion order (the index itself is never handed out)"""
+        with self._index_lock:
+            self._ensure_index()
+            records = list(self._by_id.values())
+        for record in records:
+            yield copy.deepcopy(record)
+
+    def get(self, candidate_id: str) -> Optional[Dict]:
+        """Return the record for candidate_id, if present"""
+        with self._index_lock:
+            self._ensure_index()
+            record = self._by_id.get(candidate_id)
+        return copy.deepcopy(record) if record is not None else None
+
+    def get_by_session(self, session_id: str) -> List[Dict]:
+        """Return the records saved for a session, oldest first"""
+        with self._index_lock:
+            self._ensure_index()
+            records = [self._by_id[cid] for cid in self._by_session.get(session_id, ())]
+        return copy.deepcopy(records)
+
+    def count(self) -> int:
+        """Return the number of live records"""
+        with self._index_lock:
+            self._ensure_index()
+            return len(self._by_id)
+
+    def delete(self, candidate_id: str) -> bool:
+        """Delete a record by appending a tombstone; compacts when tombstones pile up"""
+        with self._locked():
+            self._ensure_index()
+            if candidate_id not in self._by_id:
+                return False
+
+            self.append_many([{TOMBSTONE_KEY: candidate_id}])
+            self._ensure_index()
+            if self._tombstones >= max(self.compaction_min_tombstones,
+                                       len(self._by_id) * self.compaction_tombstone_ratio):
+                self.compact()
+            return True
+
+    def delete_expired(self, now_iso: str, on_expired: Optional[Callable[[Dict], None]] = None) -> Dict[str, int]:
+        """
+        Retention sweep over the in-memory index (the file is read only if it changed since
+        it was last indexed), then one streamed rewrite only if something expired. The
+        index already holds every live record, so the sweep adds no per-record memory.
+        """
+        current_time = datetime.fromisoformat(now_iso)
+
+        with self._locked():
+            self._ensure_index()
+            live = list(self._by_id.values())
+            expired = sum(1 for record in live if _is_expired(record, current_time))
+
+            if expired:
+                def kept() -> Iterator[Dict]:
+                    for record in live:
+                        if not _is_expired(record, current_time):
+                            yield record
+                        elif on_expired:
+                            on_expired(copy.deepcopy(record))
+                self._write_all(kept())
+
+        return {"scanned": len(live), "expired": expired}
+
+    def replace_all(self, records: Iterable[Dict]):
+        """Atomically replace the store contents"""
+        self._write_all(records)
+
+    def compact(self):
+        """Rewrite the file without tombstones or deleted records"""
+        with self._locked():
+            self._write_all(self.iter_records())
+
+
+class SQLiteCandidateStore(CandidateStore):
+    """
+    SQLite backend in WAL mode. candidate_id, session_id and data_retention_date are
+    indexed columns, so lookups, deletes and retention sweeps never scan in Python.
+    """
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS candidates (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            candidate_id TEXT NOT NULL UNIQUE,
+            session_id TEXT,
+            timestamp TEXT,
+            data_retention_date TEXT,
+            record TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_candidates_session ON candidates(session_id)",
+        "CREATE INDEX IF NOT EXISTS idx_candidates_retention ON candidates(data_retention_date)",
+    )
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        """Open (or create) the database and ensure the schema exists"""
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        # sqlite3 connections must not be shared across threads; Streamlit runs sessions on many
+        self._local = threading.local()
+        
+        conn = self._connection()
+        with conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row(record: Dict) -> tuple:
+        return (
+            record.get('candidate_id'),
+            record.get('session_id'),
+            record.get('timestamp'),
+            record.get('data_retention_date') or None,
+            json.dumps(record, default=str)
+        )
+
+    def append_many(self, records: List[Dict]):
+        """Insert several records in one transaction"""
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO candidates "
+                "(candidate_id, session_id, timestamp, data_retention_date, record) VALUES (?, ?, ?, ?, ?)",
+                [self._row(record) for record in records]
+            )
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Yield live records in insertion order"""
+        for (record,) in self._connection().execute("SELECT record FROM candidates ORDER BY seq"):
+            yield json.loads(record)
+
+    def get(self, candidate_id: str) -> Optional[Dict]:
+        """Return the record for candidate_id via the unique index"""
+        row = self._connection().execute(
+            "SELECT record FROM candidates WHERE candidate_id = ?", (candidate_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_by_session(self, session_id: str) -> List[Dict]:
+        """Return the records saved for a session via the session index"""
+        rows = self._connection().execute(
+            "SELECT record FROM candidates WHERE session_id = ? ORDER BY seq", (session_id,)
+        )
+        return [json.loads(record) for (record,) in rows]
+
+    def delete(self, candidate_id: str) -> bool:
+        """Delete a record by candidate_id"""
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM candidates WHERE candidate_id = ?", (candidate_id,))
+        return cursor.rowcount > 0
+
+    def delete_expired(self, now_iso: str, on_expired: Optional[Callable[[Dict], None]] = None) -> Dict[str, int]:
+        """Index-driven retention sweep; records without a retention date are kept"""
+        conn = self._connection()
+        where = "data_retention_date IS NOT NULL AND data_retention_date <= ?"
+        with conn:
+            scanned = conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+            if on_expired:
+                for (record,) in conn.execute(f"SELECT record FROM candidates WHERE {where}", (now_iso,)):
+                    on_expired(json.loads(record))
+            cursor = conn.execute(f"DELETE FROM candidates WHERE {where}", (now_iso,))
+        return {"scanned": scanned, "expired": cursor.rowcount}
+
+    def replace_all(self, records: Iterable[Dict]):
+        """Atomically replace the table contents"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM candidates")
+            conn.executemany(
+                "INSERT OR REPLACE INTO candidates "
+                "(candidate_id, session_id, timestamp, data_retention_date, record) VALUES (?, ?, ?, ?, ?)",
+                (self._row(record) for record in records)
+            )
+
+    def count(self) -> int:
+        """Return the number of records"""
+        return self._connection().execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def open_candidate_store(data_dir: str, backend: str, config: Dict) -> CandidateStore:
+    """Create the configured storage backend inside data_dir"""
+    if backend == "sqlite":
+        return SQLiteCandidateStore(os.path.join(data_dir, config["sqlite_file"]))
+    if backend == "jsonl":
+        return JSONLCandidateStore(
+            os.path.join(data_dir, config["candidates_file"]),
+            legacy_json_path=os.path.join(data_dir, config["legacy_candidates_file"]),
+            compaction_min_tombstones=config["compaction_min_tombstones"],
+            compaction_tombstone_ratio=config["compaction_tombstone_ratio"]
+        )
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def read_records_file(path: str) -> Iterator[Dict]:
+    """Yield records from a legacy JSON array file or a JSON Lines file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == '[':
+            yield from json.load(f)
+            return
+    # JSON Lines: honour tombstones
+    yield from JSONLCandidateStore(path).iter_records()
+
+
+def iter_ndjson_file(path: str) -> Iterator[Dict]:
+    """Yield records from an NDJSON file, gunzipping it if it is gzip-compressed"""
+    with open(path, 'rb') as raw:
+        compressed = raw.read(2) == b'\x1f\x8b'
+    opener = gzip.open if compressed else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def migrate_records(records: Iterable[Dict], target: CandidateStore, batch_size: int = 500) -> int:
+    """Copy records into target in batches; returns the number migrated"""
+    migrated = 0
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            target.append_many(batch)
+            migrated += len(batch)
+            batch = []
+    if batch:
+        target.append_many(batch)
+        migrated += len(batch)
+    return migrated
@@ -0,0 +1,72 @@
+"""
+Stream Renderer
+Throttled rendering of streamed LLM replies into a Streamlit placeholder.
+"""
+
+import time
+from typing import Callable, Dict, List
+
+from config import PERFORMANCE_CONFIG
+
+CURSOR = "▌"
+
+
+class ThrottledStreamRenderer:
+    """
+    Buffers streamed chunks in a list and redraws the placeholder at most once per
+    `interval` seconds, or sooner once `max_pending_chars` have piled up. Each redraw
+    resends the whole reply, so fewer redraws means proportionally less websocket
+    traffic. The first chunk is drawn immediately.
+    """
+
+    def __init__(self, placeholder, interval: float = None, max_pending_chars: int = None,
+                 cursor: str = CURSOR, clock: Callable[[], float] = time.monotonic):
+        """Initialize the renderer for a placeholder with a .markdown() method"""
+        self.placeholder = placeholder
+        self.interval = interval if interval is not None else PERFORMANCE_CONFIG["stream_render_interval_ms"] / 1000
+        self.max_pending_chars = max_pending_chars or PERFORMANCE_CONFIG["stream_render_max_pending_chars"]
+        self.cursor = cursor
+        self.clock = clock
+
+        self._text = ""
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._last_render = float("-inf")
+        self.chunks = 0
+        self.updates = 0
+        self.bytes_sent = 0
+
+    def _render(self, final: bool = False):
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending.clear()
+            self._pending_chars = 0
+        body = self._text if final else self._text + self.cursor
+        self.placeholder.markdown(body)
+        self.updates += 1
+        self.bytes_sent += len(body.encode("utf-8"))
+        self._last_render = self.clock()
+
+    def write(self, chunk: str):
+        """Buffer a chunk; redraw only when the time or size budget is spent"""
+        if not chunk:
+            return
+        self.chunks += 1
+        self._pending.append(chunk)
+        self._pending_chars += len(chunk)
+        if self._pending_chars >= self.max_pending_chars or self.clock() - self._last_render >= self.interval:
+            self._render()
+
+    def finish(self) -> str:
+        """Draw the complete reply without the cursor and return it"""
+        self._render(final=True)
+        return self._text
+
+    @property
+    def text(self) -> str:
+        """Everything received so far"""
+        return self._text + "".join(self._pending)
+
+    def stats(self) -> Dict:
+        """Chunk, redraw and payload counters for this reply"""
+        return {"chunks": self.chunks, "updates": self.updates, "bytes_sent": self.bytes_sent}
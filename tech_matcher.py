@@ -0,0 +1,110 @@
+"""
+Technology Matcher
+Word-boundary-aware multi-pattern detection of technologies using an Aho-Corasick automaton.
+"""
+
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from config import TECH_CATEGORIES, TECH_ALIASES
+
+# Words (letters/digits) and individual symbols; whitespace only separates tokens.
+# Matching runs over tokens, so "go" can never match inside "good" and "r" only as a word.
+_TOKEN = re.compile(r'[a-z0-9]+|[^\sa-z0-9]')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lower-cased text into word and symbol tokens"""
+    return _TOKEN.findall(text.lower())
+
+
+class TechMatcher:
+    """
+    Token-level Aho-Corasick automaton over technology names and aliases.
+    Built once; each scan is a single linear pass over the text's tokens.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], aliases: Optional[Dict[str, str]] = None):
+        """Build the automaton from category keyword lists and alias mappings"""
+        self.category_of = {}
+        for category, techs in categories.items():
+            for tech in techs:
+                self.category_of.setdefault(tech, category)
+
+        # pattern -> canonical technology; category terms are canonical themselves
+        patterns = {tech: tech for tech in self.category_of}
+        for alias, canonical in (aliases or {}).items():
+            # Only aliases that resolve to a categorized technology are detectable
+            if alias not in patterns and canonical in self.category_of:
+                patterns[alias] = canonical
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._output: List[List[Tuple[int, str]]] = [[]]
+        for pattern, canonical in patterns.items():
+            self._add_pattern(tokenize(pattern), canonical)
+        self._build_failure_links()
+
+    def _add_pattern(self, tokens: List[str], canonical: str):
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(tokens), canonical))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _scan(self, tokens: List[str]) -> List[Tuple[int, int, str]]:
+        """Return (start, end, canonical) token spans for every pattern occurrence"""
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        state = 0
+        for end, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for length, canonical in output[state]:
+                matches.append((end - length + 1, end, canonical))
+        return matches
+
+    def find(self, text: str) -> List[str]:
+        """Return canonical technologies mentioned in text, in order of first appearance"""
+        # Leftmost-longest: "sql-server" wins over the "sql" inside it
+        spans = sorted(self._scan(tokenize(text)), key=lambda span: (span[0], span[0] - span[1]))
+        found = []
+        covered_until = -1
+        for start, end, canonical in spans:
+            if start <= covered_until:
+                continue
+            covered_until = end
+            if canonical not in found:
+                found.append(canonical)
+        return found
+
+    def categorize(self, text: str) -> Dict[str, List[str]]:
+        """Return mentioned technologies grouped by category"""
+        categorized = {}
+        for tech in self.find(text):
+            categorized.setdefault(self.category_of[tech], []).append(tech)
+        return categorized
+
+
+# Shared automaton built once from config
+TECH_MATCHER = TechMatcher(TECH_CATEGORIES, TECH_ALIASES)
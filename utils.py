@@ -8,60 +8,24 @@ import json
 import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from config import TECH_ALIASES
+from tech_matcher import TECH_MATCHER
+from validation import VALIDATOR
 
 def validate_email(email: str) -> bool:
     """Validate email address format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email.strip()))
+    return VALIDATOR.is_valid('email', email)
 
 def validate_phone(phone: str) -> bool:
     """Validate phone number format with specific support for Indian numbers (+91)"""
-    # Remove common separators and spaces
-    cleaned = re.sub(r'[-.\s\(\)]', '', phone)
-    
-    # Check for valid patterns with extra support for Indian numbers
-    patterns = [
-        # Indian mobile numbers (with +91 prefix)
-        r'^\+91[6-9]\d{9}$',  
-        # Indian mobile numbers (without prefix, starting with 6-9)
-        r'^[6-9]\d{9}$',  
-        # International format for other countries
-        r'^\+\d{1,3}\d{8,12}$',
-        # General 10-11 digit formats
-        r'^\d{10}$',
-        r'^\d{11}$'  
-    ]
-    
-    return any(re.match(pattern, cleaned) for pattern in patterns)
+    return VALIDATOR.is_valid('phone', phone)
 
 def normalize_tech_stack(tech_list: List[str]) -> List[str]:
     """Normalize and standardize technology names"""
-    tech_mapping = {
-        'js': 'javascript',
-        'ts': 'typescript',
-        'py': 'python',
-        'nodejs': 'node.js',
-        'reactjs': 'react',
-        'vuejs': 'vue',
-        'angularjs': 'angular',
-        'postgres': 'postgresql',
-        'mongo': 'mongodb',
-        'k8s': 'kubernetes',
-        'tf': 'terraform',
-        'aws lambda': 'aws',
-        'ec2': 'aws',
-        's3': 'aws',
-        'azure functions': 'azure',
-        'gcp': 'google cloud',
-        'ml': 'machine learning',
-        'ai': 'artificial intelligence',
-        'dl': 'deep learning'
-    }
-    
     normalized = []
     for tech in tech_list:
         tech_lower = tech.lower().strip()
-        normalized_tech = tech_mapping.get(tech_lower, tech_lower)
+        normalized_tech = TECH_ALIASES.get(tech_lower, tech_lower)
         if normalized_tech not in normalized:
             normalized.append(normalized_tech)
     
@@ -253,80 +217,26 @@ def generate_interview_summary(candidate_data: Dict) -> str:
     
     return summary
 
+def detect_technologies(text: str) -> Dict[str, List[str]]:
+    """Detect technologies mentioned in text, grouped by TECH_CATEGORIES category"""
+    return TECH_MATCHER.categorize(text)
+
 def detect_programming_languages(text: str) -> List[str]:
     """Detect programming languages mentioned in text"""
-    languages = [
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
-        'ruby', 'php', 'swift', 'kotlin', 'scala', 'perl', 'r', 'matlab',
-        'objective-c', 'shell', 'bash', 'powershell', 'sql', 'html', 'css'
-    ]
-    
-    text_lower = text.lower()
-    found_languages = []
-    
-    for lang in languages:
-        if lang in text_lower:
-            found_languages.append(lang)
-    
-    return found_languages
+    return detect_technologies(text).get('programming_languages', [])
 
 def detect_frameworks_tools(text: str) -> List[str]:
     """Detect frameworks and tools mentioned in text"""
-    frameworks_tools = [
-        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'laravel',
-        'express', 'fastapi', 'rails', 'asp.net', 'node.js', 'nextjs',
-        'nuxt', 'gatsby', 'svelte', 'backbone', 'ember', 'jquery',
-        'bootstrap', 'tailwind', 'material-ui', 'ant-design',
-        'docker', 'kubernetes', 'jenkins', 'git', 'gitlab', 'github',
-        'aws', 'azure', 'gcp', 'heroku', 'netlify', 'vercel',
-        'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch',
-        'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas'
+    return [
+        tech
+        for category, techs in detect_technologies(text).items()
+        if category != 'programming_languages'
+        for tech in techs
     ]
-    
-    text_lower = text.lower()
-    found_tools = []
-    
-    for tool in frameworks_tools:
-        if tool in text_lower:
-            found_tools.append(tool)
-    
-    return found_tools
 
 def validate_candidate_data(data: Dict) -> Tuple[bool, List[str]]:
     """Validate candidate data and return validation status and errors"""
-    errors = []
-    
-    # Required fields
-    required_fields = ['name', 'email', 'experience']
-    for field in required_fields:
-        if field not in data or not data[field]:
-            errors.append(f"Missing required field: {field}")
-    
-    # Email validation
-    if 'email' in data and not validate_email(data['email']):
-        errors.append("Invalid email format")
-    
-    # Phone validation (if provided)
-    if 'phone' in data and data['phone'] and not validate_phone(data['phone']):
-        errors.append("Invalid phone number format")
-    
-    # Experience validation
-    if 'experience' in data:
-        try:
-            exp = int(data['experience'])
-            if exp < 0 or exp > 50:
-                errors.append("Experience must be between 0 and 50 years")
-        except (ValueError, TypeError):
-            errors.append("Experience must be a valid number")
-    
-    # Name validation
-    if 'name' in data:
-        name = str(data['name']).strip()
-        if len(name) < 2:
-            errors.append("Name must be at least 2 characters long")
-        if not re.match(r'^[a-zA-Z\s]+$', name):
-            errors.append("Name can only contain letters and spaces")
-    
+    errors = VALIDATOR.validate_record(data)
     return len(errors) == 0, errors
 
 def create_export_data(candidate_data: Dict, conversation_history: List = None) -> Dict:
@@ -0,0 +1,127 @@
+"""
+Validation
+Candidate field validators compiled once from config.VALIDATION_RULES.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+from config import VALIDATION_RULES
+
+_YEARS_PATTERN = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE)
+
+
+def _label(field: str) -> str:
+    return field.replace('_', ' ').capitalize()
+
+
+class FieldValidator:
+    """One field's rule with its regexes precompiled; alternative patterns share one regex"""
+
+    def __init__(self, field: str, rule: Dict):
+        """Compile the rule for a field"""
+        self.field = field
+        self.required = rule.get("required", False)
+        self.min_length = rule.get("min_length")
+        self.max_length = rule.get("max_length")
+        self.min_value = rule.get("min_value")
+        self.max_value = rule.get("max_value")
+        self.numeric = rule.get("type") == "years" or self.min_value is not None or self.max_value is not None
+        self.strip = re.compile(rule["strip"]) if rule.get("strip") else None
+
+        patterns = list(rule.get("patterns", []))
+        if rule.get("pattern"):
+            patterns.append(rule["pattern"])
+        self.pattern = re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+        self.message = rule.get("message", f"Invalid {field} format")
+
+    def _years(self, value) -> Optional[int]:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        text = str(value).strip()
+        if text.lstrip('-').isdigit():
+            return int(text)
+        match = _YEARS_PATTERN.search(text)
+        return int(match.group(1)) if match else None
+
+    def errors(self, value) -> List[str]:
+        """Return every rule violation for value (empty if valid)"""
+        label = _label(self.field)
+
+        if self.numeric:
+            number = self._years(value)
+            if number is None:
+                return [f"{label} must be a valid number"]
+            if (self.min_value is not None and number < self.min_value) or \
+                    (self.max_value is not None and number > self.max_value):
+                return [f"{label} must be between {self.min_value} and {self.max_value} years"]
+            return []
+
+        text = str(value).strip()
+        errors = []
+        if self.min_length is not None and len(text) < self.min_length:
+            errors.append(f"{label} must be at least {self.min_length} characters long")
+        if self.max_length is not None and len(text) > self.max_length:
+            errors.append(f"{label} must be at most {self.max_length} characters long")
+        if self.pattern is not None:
+            candidate = self.strip.sub('', text) if self.strip else text
+            if not self.pattern.match(candidate):
+                errors.append(self.message)
+        return errors
+
+    def is_valid(self, value) -> bool:
+        return not self.errors(value)
+
+
+class RecordValidator:
+    """Validates whole candidate records against every compiled field rule in one pass"""
+
+    def __init__(self, rules: Dict[str, Dict]):
+        """Compile all rules"""
+        self.fields = {field: FieldValidator(field, rule) for field, rule in rules.items()}
+        self.required_fields = [field for field, validator in self.fields.items() if validator.required]
+
+    def validate_field(self, field: str, value) -> List[str]:
+        """Errors for one field; fields without a rule are always valid"""
+        validator = self.fields.get(field)
+        return validator.errors(value) if validator else []
+
+    def is_valid(self, field: str, value) -> bool:
+        return not self.validate_field(field, value)
+
+    def validate_record(self, record: Dict, check_required: bool = True) -> List[str]:
+        """Return all errors for a record; empty optional fields are skipped"""
+        errors = []
+        if check_required:
+            errors.extend(f"Missing required field: {field}" for field in self.required_fields
+                          if record.get(field) in (None, ''))
+        for field, value in record.items():
+            validator = self.fields.get(field)
+            if validator is not None and value not in (None, ''):
+                errors.extend(validator.errors(value))
+        return errors
+
+    def validate_batch(self, records: Iterable[Dict], check_required: bool = True) -> List[List[str]]:
+        """Validate many records; returns one error list per record"""
+        return [self.validate_record(record, check_required) for record in records]
+
+
+# Compiled once at import
+VALIDATOR = RecordValidator(VALIDATION_RULES)
+
+
+def validate_field(field: str, value) -> List[str]:
+    """Errors for one field value"""
+    return VALIDATOR.validate_field(field, value)
+
+
+def validate_record(record: Dict, check_required: bool = True) -> List[str]:
+    """All errors for one candidate record"""
+    return VALIDATOR.validate_record(record, check_required)
+
+
+def validate_batch(records: Iterable[Dict], check_required: bool = True) -> List[List[str]]:
+    """Errors for each record in a batch"""
+    return VALIDATOR.validate_batch(records, check_required)
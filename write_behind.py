@@ -0,0 +1,255 @@
+"""
+Write-Behind Candidate Saves
+Background writer that takes candidate saves off the request path and batches them.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from storage import CandidateStore
+
+# Sentinel asking the writer thread to drain and exit
+_STOP = object()
+
+
+class WriteBehindStore(CandidateStore):
+    """
+    Wraps a CandidateStore so appends return immediately. A single writer thread drains
+    a bounded queue, coalesces queued records into one append_many per batch and syncs
+    once per batch. Every read, delete or rewrite flushes first, so callers always see
+    their own writes. When the queue is full, append blocks (backpressure). A batch that
+    fails to write is kept and retried ahead of newer records; until it lands, flush()
+    returns False and last_error holds the failure.
+    """
+
+    def __init__(self, store: CandidateStore, queue_size: int = 1000, batch_size: int = 100,
+                 flush_interval: float = 0.05, retry_interval: float = 1.0):
+        """Initialize the wrapper and start its writer thread"""
+        self.store = store
+        self.path = store.path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.last_error: Optional[Exception] = None
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._metrics = {"records": 0, "batches": 0, "largest_batch": 0, "write_errors": 0}
+        self._listeners = []
+        self._failed: List[Dict] = []  # Written by the writer thread only
+
+        self._thread = threading.Thread(target=self._run, name=f"write-behind:{self.path}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            # With a failed batch waiting, wake up to retry it even if nothing new arrives
+            try:
+                item = self._queue.get(timeout=self.retry_interval if self._failed else None)
+            except queue.Empty:
+                item = None
+            batch, waiters = [], []
+            deadline = time.monotonic() + self.flush_interval
+
+            # Coalesce whatever arrives within the flush interval, up to batch_size records
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if stopping or waiters or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            # Drain without waiting when asked to flush or stop
+            if stopping or waiters:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    elif item is not _STOP:
+                        batch.append(item)
+
+            # Failed records go first so the file keeps save order
+            batch = self._failed + batch
+            self._failed = []
+            if batch:
+                self._write(batch)
+            if stopping and self._failed:
+                print(f"Error: dropping {len(self._failed)} unwritten candidate records on shutdown")
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, batch: List[Dict], raise_errors: bool = False):
+        try:
+            self.store.append_many(batch)
+            self.store.sync()
+        except Exception as e:
+            self._metrics["write_errors"] += 1
+            if raise_errors:
+                with self._pending_lock:
+                    self._pending -= len(batch)
+                raise
+            # Keep the batch (still counted as pending) for the next attempt
+            self.last_error = e
+            self._failed = batch
+            print(f"Error writing candidate batch, will retry: {e}")
+        else:
+            self.last_error = None
+            self._metrics["records"] += len(batch)
+            self._metrics["batches"] += 1
+            self._metrics["largest_batch"] = max(self._metrics["largest_batch"], len(batch))
+            for listener in list(self._listeners):
+                try:
+                    listener(batch)
+                except Exception as e:
+                    print(f"Error in write-behind listener: {e}")
+            with self._pending_lock:
+                self._pending -= len(batch)
+
+    def add_listener(self, callback: Callable[[List[Dict]], None]):
+        """Call callback(batch) on the writer thread after each batch is written"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def append_many(self, records: List[Dict]):
+        """Queue records for the writer thread"""
+        with self._pending_lock:
+            self._pending += len(records)
+        for record in records:
+            self._queue.put(record)
+
+    def write_now(self, records: List[Dict]):
+        """Write a batch on the calling thread, after everything already queued (bulk loads)"""
+        self.flush()
+        with self._pending_lock:
+            self._pending += len(records)
+        self._write(records, raise_errors=True)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued record is written. Returns False on timeout, or when a
+        failed batch is still unwritten after one more attempt (see last_error).
+        """
+        with self._pending_lock:
+            if self._pending == 0:
+                return True
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout) and not self._failed
+
+    def close(self):
+        """Drain the queue, stop the writer thread and close the wrapped store"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self.store.close()
+
+    def stats(self) -> Dict:
+        """Return batching counters, the current queue depth and any unwritten failed batch"""
+        metrics = dict(self._metrics)
+        metrics["failed"] = len(self._failed)
+        metrics["last_error"] = str(self.last_error) if self.last_error else None
+        with self._pending_lock:
+            metrics["pending"] = self._pending
+        return metrics
+
+    # Everything else reads or rewrites the file, so it must see queued records first
+
+    def iter_records(self) -> Iterator[Dict]:
+        self.flush()
+        return self.store.iter_records()
+
+    def get(self, candidate_id: str) -> Optional[Dict]:
+        self.flush()
+        return self.store.get(candidate_id)
+
+    def get_by_session(self, session_id: str) -> List[Dict]:
+        self.flush()
+        return self.store.get_by_session(session_id)
+
+    def delete(self, candidate_id: str) -> bool:
+        self.flush()
+        return self.store.delete(candidate_id)
+
+    def delete_expired(self, now_iso: str, on_expired: Optional[Callable[[Dict], None]] = None) -> Dict[str, int]:
+        self.flush()
+        return self.store.delete_expired(now_iso, on_expired)
+
+    def replace_all(self, records: Iterable[Dict]):
+        self.flush()
+        self.store.replace_all(records)
+
+    def count(self) -> int:
+        self.flush()
+        return self.store.count()
+
+    def sync(self):
+        self.flush()
+        self.store.sync()
+
+
+_lock = threading.Lock()
+_stores = {}
+
+
+def get_write_behind_store(store: CandidateStore, queue_size: int = 1000, batch_size: int = 100,
+                           flush_interval: float = 0.05, retry_interval: float = 1.0) -> WriteBehindStore:
+    """
+    Return the process-wide write-behind wrapper for store.path, so every session
+    shares one writer thread (and one index). A redundant store is closed.
+    """
+    with _lock:
+        shared = _stores.get(store.path)
+        if shared is None:
+            shared = WriteBehindStore(store, queue_size=queue_size, batch_size=batch_size,
+                                      flush_interval=flush_interval, retry_interval=retry_interval)
+            _stores[store.path] = shared
+        elif shared.store is not store:
+            store.close()
+        return shared
+
+
+def flush_all(timeout: Optional[float] = None) -> bool:
+    """Flush every write-behind store; returns False if any timed out or has a failed batch"""
+    with _lock:
+        stores = list(_stores.values())
+    return all([shared.flush(timeout) for shared in stores])
+
+
+def close_write_behind_stores():
+    """Drain and stop every writer thread (registered to run at interpreter exit)"""
+    with _lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for shared in stores:
+        shared.close()
+
+
+def _reset_after_fork():
+    # Writer threads do not survive fork(); the child starts its own on first use
+    global _lock
+    _lock = threading.Lock()
+    _stores.clear()
+
+
+atexit.register(close_write_behind_stores)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)